@@ -2,6 +2,7 @@
 
 from collections.abc import AsyncGenerator
 from typing import Annotated
+from uuid import uuid4
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -35,6 +36,33 @@ class _AppState:
 _state = _AppState()
 
 
+class _DataVersion:
+    """Monotonic counter bumped on every project/schedule write.
+
+    The web list pages derive their ETag from it, so every write path —
+    HTMX or REST — must call ``bump`` for revalidation to see fresh data.
+    The tag is prefixed with a per-process nonce so a counter reset on
+    restart can never collide with a tag a client cached before it.
+    """
+
+    __slots__ = ("_nonce", "_value")
+
+    def __init__(self) -> None:
+        self._nonce = uuid4().hex[:8]
+        self._value = 0
+
+    def bump(self) -> None:
+        """Record a project/schedule write."""
+        self._value += 1
+
+    def etag(self) -> str:
+        """Return a weak ETag for the current version."""
+        return f'W/"{self._nonce}-{self._value}"'
+
+
+data_version = _DataVersion()
+
+
 def get_message_bus() -> InMemoryMessageBus:
     """Get the global message bus instance."""
     if _state.message_bus is None:
@@ -94,39 +122,44 @@ async def get_session() -> AsyncGenerator[AsyncSession]:
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 MessageBusDep = Annotated[InMemoryMessageBus, Depends(get_message_bus)]
 
+# Each repository gets its own session (use_cache=False) so handlers may run
+# repository calls concurrently with asyncio.gather; an AsyncSession shared
+# across concurrent coroutines is not allowed by SQLAlchemy.
+RepoSessionDep = Annotated[AsyncSession, Depends(get_session, use_cache=False)]
+
 
 # Repository dependencies
-def get_project_repository(session: SessionDep) -> ProjectRepositoryImpl:
+def get_project_repository(session: RepoSessionDep) -> ProjectRepositoryImpl:
     """Get project repository."""
     return ProjectRepositoryImpl(session)
 
 
-def get_source_repository(session: SessionDep) -> SourceRepositoryImpl:
+def get_source_repository(session: RepoSessionDep) -> SourceRepositoryImpl:
     """Get source repository."""
     return SourceRepositoryImpl(session)
 
 
-def get_item_repository(session: SessionDep) -> ItemRepositoryImpl:
+def get_item_repository(session: RepoSessionDep) -> ItemRepositoryImpl:
     """Get item repository."""
     return ItemRepositoryImpl(session)
 
 
-def get_digest_repository(session: SessionDep) -> DigestRepositoryImpl:
+def get_digest_repository(session: RepoSessionDep) -> DigestRepositoryImpl:
     """Get digest repository."""
     return DigestRepositoryImpl(session)
 
 
-def get_schedule_repository(session: SessionDep) -> ScheduleRepositoryImpl:
+def get_schedule_repository(session: RepoSessionDep) -> ScheduleRepositoryImpl:
     """Get schedule repository."""
     return ScheduleRepositoryImpl(session)
 
 
-def get_error_repository(session: SessionDep) -> CollectorErrorRepositoryImpl:
+def get_error_repository(session: RepoSessionDep) -> CollectorErrorRepositoryImpl:
     """Get collector error repository."""
     return CollectorErrorRepositoryImpl(session)
 
 
-def get_settings_repository(session: SessionDep) -> SettingsRepositoryImpl:
+def get_settings_repository(session: RepoSessionDep) -> SettingsRepositoryImpl:
     """Get settings repository."""
     return SettingsRepositoryImpl(session)
 
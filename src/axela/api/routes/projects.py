@@ -5,7 +5,7 @@ from uuid import UUID
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 
-from axela.api.deps import ProjectRepoDep
+from axela.api.deps import ProjectRepoDep, data_version
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
@@ -53,6 +53,7 @@ async def create_project(
         )
 
     project = await repo.create(name=data.name, color=data.color)
+    data_version.bump()
     return ProjectResponse(
         id=project.id,
         name=project.name,
@@ -122,6 +123,7 @@ async def update_project(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
+    data_version.bump()
     return ProjectResponse(
         id=project.id,
         name=project.name,
@@ -142,3 +144,4 @@ async def delete_project(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
+    data_version.bump()
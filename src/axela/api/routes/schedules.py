@@ -5,7 +5,7 @@ from uuid import UUID
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 
-from axela.api.deps import ScheduleRepoDep
+from axela.api.deps import ScheduleRepoDep, data_version
 from axela.domain.enums import DigestType
 
 router = APIRouter(prefix="/schedules", tags=["schedules"])
@@ -62,6 +62,7 @@ async def create_schedule(
         timezone=data.timezone,
         project_ids=data.project_ids,
     )
+    data_version.bump()
     return ScheduleResponse(
         id=schedule.id,
         name=schedule.name,
@@ -137,6 +138,7 @@ async def update_schedule(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Schedule not found",
         )
+    data_version.bump()
     return ScheduleResponse(
         id=schedule.id,
         name=schedule.name,
@@ -161,3 +163,4 @@ async def delete_schedule(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Schedule not found",
         )
+    data_version.bump()
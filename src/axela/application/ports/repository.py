@@ -75,6 +75,18 @@ class SourceRepository(Protocol):
         """Get all active sources."""
         ...
 
+    async def count_active_by_project(self) -> dict[UUID, int]:
+        """Count active sources grouped by project ID."""
+        ...
+
+    async def get_active_with_project(self) -> list[tuple[Source, str]]:
+        """Get all active sources joined with their project name."""
+        ...
+
+    async def get_by_project_with_project(self, project_id: UUID) -> list[tuple[Source, str]]:
+        """Get sources for a project joined with the project name."""
+        ...
+
     async def get_by_type(self, source_type: SourceType) -> list[Source]:
         """Get all sources of a specific type."""
         ...
@@ -280,10 +292,18 @@ class SettingsRepository(Protocol):
         """Get all settings."""
         ...
 
+    async def get_all_map(self) -> dict[str, Any]:
+        """Get all settings as a key-to-value mapping."""
+        ...
+
     async def set(self, key: str, value: Any) -> Setting:
         """Set a setting value (insert or update)."""
         ...
 
+    async def set_many(self, items: dict[str, Any]) -> None:
+        """Set multiple settings in a single statement."""
+        ...
+
     async def delete(self, key: str) -> bool:
         """Delete a setting."""
         ...
@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import and_, desc, select, update
+from sqlalchemy import and_, desc, func, select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -142,6 +142,36 @@ class SourceRepositoryImpl:
         result = await self._session.execute(stmt)
         return [self._to_domain(m) for m in result.scalars()]
 
+    async def count_active_by_project(self) -> dict[UUID, int]:
+        """Count active sources per project with a single grouped query."""
+        stmt = (
+            select(SourceModel.project_id, func.count())
+            .where(SourceModel.is_active == True)  # noqa: E712
+            .group_by(SourceModel.project_id)
+        )
+        result = await self._session.execute(stmt)
+        return dict(result.all())  # type: ignore[arg-type]
+
+    async def get_active_with_project(self) -> list[tuple[Source, str]]:
+        """Get active sources with their project name in one JOIN query."""
+        stmt = (
+            select(SourceModel, ProjectModel.name)
+            .join(ProjectModel, SourceModel.project_id == ProjectModel.id)
+            .where(SourceModel.is_active == True)  # noqa: E712
+        )
+        result = await self._session.execute(stmt)
+        return [(self._to_domain(m), name) for m, name in result.all()]
+
+    async def get_by_project_with_project(self, project_id: UUID) -> list[tuple[Source, str]]:
+        """Get a project's sources with the project name in one JOIN query."""
+        stmt = (
+            select(SourceModel, ProjectModel.name)
+            .join(ProjectModel, SourceModel.project_id == ProjectModel.id)
+            .where(SourceModel.project_id == project_id)
+        )
+        result = await self._session.execute(stmt)
+        return [(self._to_domain(m), name) for m, name in result.all()]
+
     async def get_by_type(self, source_type: SourceType) -> list[Source]:
         """Get all sources of a specific type."""
         stmt = select(SourceModel).where(SourceModel.source_type == source_type.value)
@@ -606,6 +636,19 @@ class CollectorErrorRepositoryImpl:
         )
 
 
+# Precompiled settings upsert: without inline values it takes parameter
+# sets at execute time, so SQLAlchemy compiles it once and runs the whole
+# batch through the executemany path.
+_settings_insert = insert(SettingModel)
+_SETTINGS_UPSERT = _settings_insert.on_conflict_do_update(
+    index_elements=[SettingModel.key],
+    set_={
+        "value": _settings_insert.excluded.value,
+        "updated_at": _settings_insert.excluded.updated_at,
+    },
+)
+
+
 class SettingsRepositoryImpl:
     """SQLAlchemy implementation of SettingsRepository."""
 
@@ -624,6 +667,16 @@ class SettingsRepositoryImpl:
         result = await self._session.execute(stmt)
         return [self._to_domain(m) for m in result.scalars()]
 
+    async def get_all_map(self) -> dict[str, Any]:
+        """Get all settings as a key-to-value mapping.
+
+        Projects only the two columns in SQL instead of materializing full
+        Setting rows that callers immediately collapse into a dict.
+        """
+        stmt = select(SettingModel.key, SettingModel.value)
+        result = await self._session.execute(stmt)
+        return dict(result.all())  # type: ignore[arg-type]
+
     async def set(self, key: str, value: Any) -> Setting:
         """Set a setting value (upsert)."""
         model = await self._session.get(SettingModel, key)
@@ -636,6 +689,16 @@ class SettingsRepositoryImpl:
         await self._session.flush()
         return self._to_domain(model)
 
+    async def set_many(self, items: dict[str, Any]) -> None:
+        """Upsert multiple settings with a single statement."""
+        if not items:
+            return
+        now = datetime.now(UTC)
+        await self._session.execute(
+            _SETTINGS_UPSERT,
+            [{"key": key, "value": value, "updated_at": now} for key, value in items.items()],
+        )
+
     async def delete(self, key: str) -> bool:
         """Delete setting by key."""
         model = await self._session.get(SettingModel, key)
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from axela.config import get_settings
+from axela.infrastructure.database.types import json_decode, json_encode
 
 
 @lru_cache
@@ -30,6 +31,8 @@ def get_async_engine() -> AsyncEngine:
             settings.database_url,
             echo=settings.log_level == "DEBUG",
             connect_args={"check_same_thread": False},
+            json_serializer=json_encode,
+            json_deserializer=json_decode,
         )
 
     # PostgreSQL configuration (with connection pooling)
@@ -39,6 +42,8 @@ def get_async_engine() -> AsyncEngine:
         pool_pre_ping=True,
         pool_size=5,
         max_overflow=10,
+        json_serializer=json_encode,
+        json_deserializer=json_decode,
     )
 
 
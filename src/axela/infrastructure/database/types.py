@@ -1,9 +1,9 @@
 """Cross-platform SQLAlchemy types for PostgreSQL and SQLite support."""
 
-import json
-from typing import Any
-from uuid import UUID
+from typing import Any, ClassVar
+from uuid import UUID, SafeUUID
 
+import orjson
 from sqlalchemy import JSON, Text
 from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY
 from sqlalchemy.dialects.postgresql import JSONB as PG_JSONB
@@ -12,6 +12,34 @@ from sqlalchemy.engine import Dialect
 from sqlalchemy.types import CHAR, TypeDecorator, TypeEngine
 
 
+def _parse_uuid(value: str) -> UUID:
+    """Parse a hex UUID string, skipping ``UUID.__init__`` validation.
+
+    Result rows come from our own GUID columns, so the 8-4-4-4-12 layout is
+    trusted; going through ``int(..., 16)`` and ``UUID.__new__`` avoids the
+    constructor's per-value normalization, which dominates bulk row loads.
+    Non-hex input still raises ValueError.
+    """
+    uid = UUID.__new__(UUID)
+    object.__setattr__(uid, "int", int(value.replace("-", ""), 16))
+    object.__setattr__(uid, "is_safe", SafeUUID.unknown)
+    return uid
+
+
+def json_encode(value: Any) -> str:
+    """Serialize a value to a JSON string with orjson.
+
+    Shared by the custom types below and the engine-level
+    ``json_serializer`` so all JSON columns use the same fast codec.
+    """
+    return orjson.dumps(value).decode()
+
+
+def json_decode(value: str | bytes) -> Any:
+    """Deserialize a JSON string with orjson."""
+    return orjson.loads(value)
+
+
 class GUID(TypeDecorator[UUID]):
     """Platform-independent GUID type.
 
@@ -21,11 +49,18 @@ class GUID(TypeDecorator[UUID]):
     impl = CHAR
     cache_ok = True
 
+    _dialect_cache: ClassVar[dict[str, TypeEngine[Any]]] = {}
+
     def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
-        """Return dialect-specific type implementation."""
-        if dialect.name == "postgresql":
-            return dialect.type_descriptor(PG_UUID(as_uuid=True))
-        return dialect.type_descriptor(CHAR(36))
+        """Return dialect-specific type implementation, cached per dialect."""
+        impl = self._dialect_cache.get(dialect.name)
+        if impl is None:
+            if dialect.name == "postgresql":
+                impl = dialect.type_descriptor(PG_UUID(as_uuid=True))
+            else:
+                impl = dialect.type_descriptor(CHAR(36))
+            self._dialect_cache[dialect.name] = impl
+        return impl
 
     def process_bind_param(self, value: UUID | str | None, dialect: Dialect) -> Any:
         """Convert Python UUID to database format."""
@@ -41,7 +76,7 @@ class GUID(TypeDecorator[UUID]):
             return None
         if isinstance(value, UUID):
             return value
-        return UUID(value)
+        return _parse_uuid(value)
 
 
 class JSONB(TypeDecorator[dict[str, Any]]):
@@ -53,11 +88,15 @@ class JSONB(TypeDecorator[dict[str, Any]]):
     impl = JSON
     cache_ok = True
 
+    _dialect_cache: ClassVar[dict[str, TypeEngine[Any]]] = {}
+
     def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
-        """Return dialect-specific type implementation."""
-        if dialect.name == "postgresql":
-            return dialect.type_descriptor(PG_JSONB())
-        return dialect.type_descriptor(JSON())
+        """Return dialect-specific type implementation, cached per dialect."""
+        impl = self._dialect_cache.get(dialect.name)
+        if impl is None:
+            impl = dialect.type_descriptor(PG_JSONB() if dialect.name == "postgresql" else JSON())
+            self._dialect_cache[dialect.name] = impl
+        return impl
 
 
 class UUIDArray(TypeDecorator[list[UUID]]):
@@ -69,11 +108,18 @@ class UUIDArray(TypeDecorator[list[UUID]]):
     impl = Text
     cache_ok = True
 
+    _dialect_cache: ClassVar[dict[str, TypeEngine[Any]]] = {}
+
     def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
-        """Return dialect-specific type implementation."""
-        if dialect.name == "postgresql":
-            return dialect.type_descriptor(PG_ARRAY(PG_UUID(as_uuid=True)))
-        return dialect.type_descriptor(Text())
+        """Return dialect-specific type implementation, cached per dialect."""
+        impl = self._dialect_cache.get(dialect.name)
+        if impl is None:
+            if dialect.name == "postgresql":
+                impl = dialect.type_descriptor(PG_ARRAY(PG_UUID(as_uuid=True)))
+            else:
+                impl = dialect.type_descriptor(Text())
+            self._dialect_cache[dialect.name] = impl
+        return impl
 
     def process_bind_param(self, value: list[UUID] | None, dialect: Dialect) -> Any:
         """Convert Python list of UUIDs to database format."""
@@ -82,7 +128,7 @@ class UUIDArray(TypeDecorator[list[UUID]]):
         if dialect.name == "postgresql":
             return value
         # For SQLite, serialize to JSON string
-        return json.dumps([str(uid) for uid in value])
+        return json_encode([str(uid) for uid in value])
 
     def process_result_value(self, value: Any, dialect: Dialect) -> list[UUID]:  # noqa: ARG002
         """Convert database value to Python list of UUIDs."""
@@ -94,7 +140,7 @@ class UUIDArray(TypeDecorator[list[UUID]]):
         # For SQLite, deserialize from JSON string
         if isinstance(value, str):
             try:
-                return [UUID(uid) for uid in json.loads(value)]
-            except (json.JSONDecodeError, ValueError):
+                return [_parse_uuid(uid) for uid in json_decode(value)]
+            except (orjson.JSONDecodeError, ValueError):
                 return []
         return []
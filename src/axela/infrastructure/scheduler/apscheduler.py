@@ -1,13 +1,15 @@
 """APScheduler 4 wrapper for digest scheduling."""
 
+import asyncio
 import contextlib
 from collections.abc import Callable, Coroutine
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
 import structlog
-from apscheduler import AsyncScheduler
+from apscheduler import AsyncScheduler, ConflictPolicy
 from apscheduler.datastores.sqlalchemy import SQLAlchemyDataStore
 from apscheduler.eventbrokers.asyncpg import AsyncpgEventBroker
 from apscheduler.triggers.cron import CronTrigger
@@ -20,6 +22,16 @@ logger = structlog.get_logger()
 # Type alias for job functions
 JobFunc = Callable[..., Coroutine[Any, Any, None]]
 
+# Bound on concurrent datastore writes during sync, sized below the engine's
+# default connection pool so a large sync cannot exhaust it.
+_SYNC_CONCURRENCY = 8
+
+
+@lru_cache(maxsize=64)
+def _zoneinfo(tz_name: str) -> ZoneInfo:
+    """Return a shared ZoneInfo, avoiding repeated tzdata loads."""
+    return ZoneInfo(tz_name)
+
 
 class DigestScheduler:
     """Scheduler wrapper for managing digest schedules with APScheduler 4."""
@@ -36,6 +48,9 @@ class DigestScheduler:
         self._event_broker = AsyncpgEventBroker.from_async_sqla_engine(engine)
         self._scheduler: AsyncScheduler | None = None
         self._job_func: JobFunc | None = None
+        # Content hash per schedule id, used to skip datastore writes when a
+        # re-synced schedule has not actually changed.
+        self._schedule_state: dict[str, int] = {}
 
     def set_job_function(self, func: JobFunc) -> None:
         """Set the function to call when a schedule triggers.
@@ -69,11 +84,26 @@ class DigestScheduler:
         self._scheduler = None
         logger.info("Scheduler stopped")
 
-    async def add_schedule(self, schedule: Schedule) -> None:
+    @staticmethod
+    def _state_hash(schedule: Schedule) -> int:
+        """Hash the fields that determine a schedule's datastore entry."""
+        return hash(
+            (
+                schedule.cron_expression,
+                schedule.timezone,
+                schedule.digest_type,
+                tuple(schedule.project_ids),
+                schedule.is_active,
+            )
+        )
+
+    async def add_schedule(self, schedule: Schedule, *, remove_existing: bool = True) -> None:
         """Add or update a schedule.
 
         Args:
             schedule: Schedule domain model
+            remove_existing: Remove any existing entry first; sync_schedules
+                passes False after batch-removing stale entries itself
 
         """
         if self._scheduler is None:
@@ -86,20 +116,28 @@ class DigestScheduler:
 
         schedule_id = str(schedule.id)
 
-        # Remove existing schedule if it exists
-        with contextlib.suppress(Exception):
-            await self._scheduler.remove_schedule(schedule_id)
+        # Skip the remove/add round-trips entirely if nothing changed since
+        # the last successful add for this id.
+        state = self._state_hash(schedule)
+        if self._schedule_state.get(schedule_id) == state:
+            logger.debug("Schedule unchanged, skipping", schedule_id=schedule_id)
+            return
 
+        # Only deactivation needs an explicit remove; active schedules are
+        # written with ConflictPolicy.replace, so no pre-remove round-trip.
         if not schedule.is_active:
+            if remove_existing:
+                with contextlib.suppress(Exception):
+                    await self._scheduler.remove_schedule(schedule_id)
+            self._schedule_state[schedule_id] = state
             logger.info("Schedule is inactive, not adding", schedule_id=schedule_id)
             return
 
-        # Create cron trigger with timezone
+        # Create cron trigger with timezone. Triggers are stateful in
+        # APScheduler 4 (add_schedule advances them via next()), so each
+        # schedule needs a fresh instance; only the ZoneInfo is shared.
         try:
-            trigger = CronTrigger.from_crontab(
-                schedule.cron_expression,
-                timezone=ZoneInfo(schedule.timezone),
-            )
+            trigger = CronTrigger.from_crontab(schedule.cron_expression, timezone=_zoneinfo(schedule.timezone))
         except Exception as e:
             logger.exception(
                 "Invalid cron expression",
@@ -119,8 +157,11 @@ class DigestScheduler:
                 "digest_type": schedule.digest_type.value,
                 "project_ids": schedule.project_ids,
             },
+            conflict_policy=ConflictPolicy.replace,
         )
 
+        self._schedule_state[schedule_id] = state
+
         logger.info(
             "Schedule added",
             schedule_id=schedule_id,
@@ -140,13 +181,16 @@ class DigestScheduler:
             msg = "Scheduler not started"
             raise RuntimeError(msg)
 
+        id_str = str(schedule_id)
+        self._schedule_state.pop(id_str, None)
+
         try:
-            await self._scheduler.remove_schedule(str(schedule_id))
-            logger.info("Schedule removed", schedule_id=str(schedule_id))
+            await self._scheduler.remove_schedule(id_str)
+            logger.info("Schedule removed", schedule_id=id_str)
         except Exception as e:
             logger.warning(
                 "Failed to remove schedule",
-                schedule_id=str(schedule_id),
+                schedule_id=id_str,
                 error=str(e),
             )
 
@@ -163,15 +207,39 @@ class DigestScheduler:
             msg = "Scheduler not started"
             raise RuntimeError(msg)
 
-        # Add/update all schedules
-        for schedule in schedules:
+        # Batch-remove entries for deactivated schedules in one datastore
+        # call; active schedules are added with ConflictPolicy.replace and
+        # need no removal at all.
+        stale_ids = [
+            str(schedule.id)
+            for schedule in schedules
+            if not schedule.is_active and self._schedule_state.get(str(schedule.id)) != self._state_hash(schedule)
+        ]
+        if stale_ids:
             try:
-                await self.add_schedule(schedule)
+                await self._data_store.remove_schedules(stale_ids)
             except Exception as e:
-                logger.exception(
+                logger.warning("Batch schedule removal failed", error=str(e))
+
+        # Add/update all schedules concurrently to pipeline the datastore writes
+        semaphore = asyncio.Semaphore(_SYNC_CONCURRENCY)
+
+        async def _add(schedule: Schedule) -> None:
+            async with semaphore:
+                await self.add_schedule(schedule, remove_existing=False)
+
+        results = await asyncio.gather(
+            *(_add(schedule) for schedule in schedules),
+            return_exceptions=True,
+        )
+
+        for schedule, result in zip(schedules, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(
                     "Failed to add schedule during sync",
                     schedule_id=str(schedule.id),
-                    error=str(e),
+                    error=str(result),
+                    exc_info=result,
                 )
 
         logger.info("Schedules synced", count=len(schedules))
@@ -1,7 +1,7 @@
 """Digest formatter for Telegram messages."""
 
-from collections import defaultdict
 from datetime import UTC, datetime
+from functools import lru_cache
 from uuid import UUID
 
 from axela.domain.enums import DigestType, ItemType
@@ -31,97 +31,109 @@ def format_digest(
 
     summaries = summaries or {}
 
-    # Group items by project
-    by_project: dict[UUID, list[tuple[DigestItem, UUID]]] = defaultdict(list)
-    projects: dict[UUID, Project] = {}
-
-    for item, item_id, project in items:
-        by_project[project.id].append((item, item_id))
-        projects[project.id] = project
+    # Group items by project in a single pass; the grouped dict carries the
+    # Project alongside its items so no second lookup table is needed.
+    by_project: dict[UUID, tuple[Project, list[DigestItem]]] = {}
+    for item, _item_id, project in items:
+        by_project.setdefault(project.id, (project, []))[1].append(item)
 
     # Build message
     lines: list[str] = []
+    append = lines.append
 
     # Header
-    lines.append(_get_header(digest_type, len(items), language))
-    lines.append("")
+    append(_get_header(digest_type, len(items), language))
+    append("")
 
     # Items grouped by project
-    for project_id, project_items in by_project.items():
-        project = projects[project_id]
-        color_emoji = _get_color_emoji(project.color)
-
-        lines.append(f"{color_emoji} <b>{_escape_html(project.name)}</b>")
+    for project_id, (project, project_items) in by_project.items():
+        append(_project_header(project.id, project.name, project.color))
 
         # Add AI summary if available
         if project_id in summaries:
-            lines.append(f"📝 <i>{_escape_html(summaries[project_id])}</i>")
+            append(f"📝 <i>{_escape_html(summaries[project_id])}</i>")
 
-        lines.append("")
+        append("")
 
-        for item, _ in project_items:
-            formatted = _format_item(item)
-            lines.append(formatted)
+        for item in project_items:
+            append(_format_item(item))
 
-        lines.append("")
+        append("")
 
     # Footer
-    lines.append(_get_footer(language))
+    append(_get_footer(language))
 
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=256)
+def _project_header(project_id: UUID, name: str, color: str | None) -> str:  # noqa: ARG001
+    """Render the project header line, memoized per project.
+
+    Keyed by id plus the rendered fields so a renamed or recolored project
+    gets a fresh entry while repeated digests reuse the escaped string.
+    """
+    return f"{_get_color_emoji(color)} <b>{_escape_html(name)}</b>"
+
+
+# Digest titles per (language, digest type), built once at import
+_DIGEST_TITLES: dict[tuple[str, DigestType], str] = {
+    ("ru", DigestType.MORNING): "🌅 Утренний дайджест",
+    ("ru", DigestType.EVENING): "🌆 Вечерний дайджест",
+    ("ru", DigestType.WEEKLY): "📅 Недельный дайджест",
+    ("ru", DigestType.MONTHLY): "📆 Месячный дайджест",
+    ("ru", DigestType.ON_DEMAND): "📋 Дайджест",
+    ("en", DigestType.MORNING): "🌅 Morning Digest",
+    ("en", DigestType.EVENING): "🌆 Evening Digest",
+    ("en", DigestType.WEEKLY): "📅 Weekly Digest",
+    ("en", DigestType.MONTHLY): "📆 Monthly Digest",
+    ("en", DigestType.ON_DEMAND): "📋 Digest",
+}
+
+_SUPPORTED_LANGUAGES = frozenset({"ru", "en"})
+
+
+def _normalize_language(language: str) -> str:
+    """Fall back to English for unsupported languages."""
+    return language if language in _SUPPORTED_LANGUAGES else "en"
+
+
 def _get_header(digest_type: DigestType, count: int, language: str) -> str:
     """Get digest header based on type and language."""
-    type_names = {
-        "ru": {
-            DigestType.MORNING: "🌅 Утренний дайджест",
-            DigestType.EVENING: "🌆 Вечерний дайджест",
-            DigestType.WEEKLY: "📅 Недельный дайджест",
-            DigestType.MONTHLY: "📆 Месячный дайджест",
-            DigestType.ON_DEMAND: "📋 Дайджест",
-        },
-        "en": {
-            DigestType.MORNING: "🌅 Morning Digest",
-            DigestType.EVENING: "🌆 Evening Digest",
-            DigestType.WEEKLY: "📅 Weekly Digest",
-            DigestType.MONTHLY: "📆 Monthly Digest",
-            DigestType.ON_DEMAND: "📋 Digest",
-        },
-    }
+    lang = _normalize_language(language)
+    title = _DIGEST_TITLES.get((lang, digest_type)) or _DIGEST_TITLES[(lang, DigestType.ON_DEMAND)]
 
-    count_text = {
-        "ru": f"{count} обновлений" if count != 1 else "1 обновление",
-        "en": f"{count} updates" if count != 1 else "1 update",
-    }
+    if lang == "ru":
+        count_text = f"{count} обновлений" if count != 1 else "1 обновление"
+    else:
+        count_text = f"{count} updates" if count != 1 else "1 update"
 
-    lang = language if language in type_names else "en"
-    title = type_names[lang].get(digest_type, type_names[lang][DigestType.ON_DEMAND])
+    return f"<b>{title}</b> ({count_text})"
 
-    return f"<b>{title}</b> ({count_text[lang]})"
+
+# Empty-digest messages per language
+_EMPTY_MESSAGES = {
+    "ru": "✨ Нет новых обновлений",
+    "en": "✨ No new updates",
+}
 
 
 def _get_empty_message(digest_type: DigestType, language: str) -> str:  # noqa: ARG001
     """Get message for empty digest."""
-    messages = {
-        "ru": "✨ Нет новых обновлений",
-        "en": "✨ No new updates",
-    }
-    lang = language if language in messages else "en"
-    return messages[lang]
+    return _EMPTY_MESSAGES[_normalize_language(language)]
+
+
+# Footer templates per language; only the timestamp is filled in per call
+_FOOTER_TEMPLATES = {
+    "ru": "<i>Сгенерировано в {time}</i>",
+    "en": "<i>Generated at {time}</i>",
+}
 
 
 def _get_footer(language: str) -> str:
     """Get digest footer."""
-    now = datetime.now(UTC)
-    time_str = now.strftime("%H:%M")
-
-    footers = {
-        "ru": f"<i>Сгенерировано в {time_str}</i>",
-        "en": f"<i>Generated at {time_str}</i>",
-    }
-    lang = language if language in footers else "en"
-    return footers[lang]
+    time_str = datetime.now(UTC).strftime("%H:%M")
+    return _FOOTER_TEMPLATES[_normalize_language(language)].format(time=time_str)
 
 
 def _format_item(item: DigestItem) -> str:
@@ -155,23 +167,24 @@ def _get_item_icon(item_type: ItemType) -> str:
     return icons.get(item_type, "📌")
 
 
+# Common metadata fields rendered in order: (content key, display prefix)
+_META_FIELDS = (
+    ("status", ""),
+    ("priority", ""),
+    ("assignee", ""),
+    ("sender", "from "),
+)
+
+
 def _get_item_metadata(item: DigestItem) -> list[str]:
     """Extract relevant metadata from item content."""
     meta: list[str] = []
     content = item.content
 
     # Common metadata fields
-    if status := content.get("status"):
-        meta.append(_escape_html(str(status)))
-
-    if priority := content.get("priority"):
-        meta.append(_escape_html(str(priority)))
-
-    if assignee := content.get("assignee"):
-        meta.append(_escape_html(str(assignee)))
-
-    if sender := content.get("sender"):
-        meta.append(f"from {_escape_html(str(sender))}")
+    for key, prefix in _META_FIELDS:
+        if value := content.get(key):
+            meta.append(prefix + _escape_html(str(value)))
 
     if participants := content.get("participants"):
         if isinstance(participants, int):
@@ -182,44 +195,52 @@ def _get_item_metadata(item: DigestItem) -> list[str]:
     return meta
 
 
+# Map hex colors to closest emoji
+_COLOR_EMOJI_MAP = {
+    "#FF0000": "🔴",
+    "#00FF00": "🟢",
+    "#0000FF": "🔵",
+    "#FFFF00": "🟡",
+    "#FF00FF": "🟣",
+    "#00FFFF": "🔵",
+    "#FFA500": "🟠",
+    "#800080": "🟣",
+    "#008000": "🟢",
+    "#000000": "⚫",
+    "#FFFFFF": "⚪",
+}
+
+# Fallback emoji by first hex digit of the color
+_COLOR_EMOJI_DEFAULTS = {
+    "F": "🟠",
+    "E": "🟡",
+    "D": "🟡",
+    "C": "🟢",
+    "B": "🔵",
+    "A": "🔵",
+    "9": "🟣",
+    "8": "🟣",
+}
+
+
+@lru_cache(maxsize=256)
 def _get_color_emoji(color: str | None) -> str:
-    """Get emoji based on project color."""
+    """Get emoji based on project color.
+
+    Cached: project colors are low-cardinality, so repeated digests hit the
+    cache instead of re-normalizing the hex string.
+    """
     if not color:
         return "📁"
 
-    # Map hex colors to closest emoji
-    color_map = {
-        "#FF0000": "🔴",
-        "#00FF00": "🟢",
-        "#0000FF": "🔵",
-        "#FFFF00": "🟡",
-        "#FF00FF": "🟣",
-        "#00FFFF": "🔵",
-        "#FFA500": "🟠",
-        "#800080": "🟣",
-        "#008000": "🟢",
-        "#000000": "⚫",
-        "#FFFFFF": "⚪",
-    }
-
     # Normalize color
     color_upper = color.upper()
-    if color_upper in color_map:
-        return color_map[color_upper]
+    if color_upper in _COLOR_EMOJI_MAP:
+        return _COLOR_EMOJI_MAP[color_upper]
 
     # Return default based on first character of hex
     first_char = color_upper[1] if len(color_upper) > 1 else "0"
-    defaults = {
-        "F": "🟠",
-        "E": "🟡",
-        "D": "🟡",
-        "C": "🟢",
-        "B": "🔵",
-        "A": "🔵",
-        "9": "🟣",
-        "8": "🟣",
-    }
-    return defaults.get(first_char, "📁")
+    return _COLOR_EMOJI_DEFAULTS.get(first_char, "📁")
 
 
 def _escape_html(text: str) -> str:
@@ -227,6 +248,13 @@ def _escape_html(text: str) -> str:
     return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
 
+# Error-alert strings per language: (header, source label, type label, message label)
+_ERROR_LABELS = {
+    "ru": ("⚠️ <b>Ошибка коллектора</b>", "Источник", "Тип", "Сообщение"),
+    "en": ("⚠️ <b>Collector Error</b>", "Source", "Type", "Message"),
+}
+
+
 def format_error_alert(
     source_name: str,
     error_type: str,
@@ -245,22 +273,13 @@ def format_error_alert(
         Formatted HTML string
 
     """
-    headers = {
-        "ru": "⚠️ <b>Ошибка коллектора</b>",
-        "en": "⚠️ <b>Collector Error</b>",
-    }
-
-    source_labels = {"ru": "Источник", "en": "Source"}
-    type_labels = {"ru": "Тип", "en": "Type"}
-    message_labels = {"ru": "Сообщение", "en": "Message"}
-
-    lang = language if language in headers else "en"
+    header, source_label, type_label, message_label = _ERROR_LABELS[_normalize_language(language)]
 
     return (
-        f"{headers[lang]}\n\n"
-        f"<b>{source_labels[lang]}:</b> {_escape_html(source_name)}\n"
-        f"<b>{type_labels[lang]}:</b> {_escape_html(error_type)}\n"
-        f"<b>{message_labels[lang]}:</b> {_escape_html(error_message)}"
+        f"{header}\n\n"
+        f"<b>{source_label}:</b> {_escape_html(source_name)}\n"
+        f"<b>{type_label}:</b> {_escape_html(error_type)}\n"
+        f"<b>{message_label}:</b> {_escape_html(error_message)}"
     )
 
 
@@ -48,6 +48,8 @@ def main() -> None:
         port=settings.api_port,
         reload=False,
         log_level=settings.log_level.lower(),
+        loop="uvloop",
+        http="httptools",
     )
 
 
@@ -1,18 +1,26 @@
 """Web frontend routes using Jinja2 templates and HTMX."""
 
+import asyncio
+import contextlib
 import json
+import tempfile
+import time
+from functools import cache
 from pathlib import Path
 from typing import Annotated, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Form, Query, Request
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request, Response
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+from pydantic import BaseModel
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from axela.api.deps import (
+    data_version,
     get_project_repository,
     get_schedule_repository,
     get_session,
@@ -30,9 +38,40 @@ from axela.application.ports.repository import (
 from axela.domain.enums import SourceType
 from axela.infrastructure.collectors.base import CollectorRegistry
 
-# Setup templates
+# Setup templates; the bytecode cache persists compiled templates across
+# process restarts so they are parsed at most once per change.
 TEMPLATES_DIR = Path(__file__).parent / "templates"
+_JINJA_CACHE_DIR = Path(tempfile.gettempdir()) / "axela-jinja-cache"
+_JINJA_CACHE_DIR.mkdir(exist_ok=True)
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+templates.env.bytecode_cache = FileSystemBytecodeCache(directory=str(_JINJA_CACHE_DIR))
+
+
+def _stream_template(
+    request: Request,
+    name: str,
+    context: dict[str, Any],
+    headers: dict[str, str] | None = None,
+) -> StreamingResponse:
+    """Stream a rendered page chunk-by-chunk instead of buffering the HTML.
+
+    Used for list pages whose body can grow large; tiny HTMX partials keep
+    ``TemplateResponse`` since streaming overhead would exceed the payload.
+    """
+    template = templates.get_template(name)
+    return StreamingResponse(
+        template.generate(request=request, **context),
+        media_type="text/html; charset=utf-8",
+        headers=headers,
+    )
+
+
+# List pages derive their ETag from the shared data-version counter so
+# unchanged data answers with a 304 before any query or render.
+# no-cache forces revalidation on every request, so a client sees its
+# own write immediately.
+_LIST_CACHE_CONTROL = "private, no-cache"
+
 
 # Create routers with basic auth
 router = APIRouter(prefix="", tags=["web"], dependencies=[Depends(verify_credentials)])
@@ -52,13 +91,18 @@ async def dashboard(
     schedule_repo: Annotated[ScheduleRepository, Depends(get_schedule_repository)],
 ) -> HTMLResponse:
     """Render dashboard page with overview statistics."""
-    projects = await project_repo.get_all()
-    sources = await source_repo.get_active()
-    schedules = await schedule_repo.get_active()
+    # Run the three independent queries concurrently (each repository has its
+    # own session) so page latency is the max of the three, not the sum.
+    # Source counts are aggregated in SQL instead of fetching every row.
+    projects, source_counts, schedules = await asyncio.gather(
+        project_repo.get_all(),
+        source_repo.count_active_by_project(),
+        schedule_repo.get_active(),
+    )
 
     stats = {
         "projects": len(projects),
-        "sources": len(sources),
+        "sources": sum(source_counts.values()),
         "schedules": len(schedules),
         "digests_sent": 0,  # Placeholder for future implementation
     }
@@ -70,7 +114,7 @@ async def dashboard(
             "id": project.id,
             "name": project.name,
             "color": project.color,
-            "sources_count": len([s for s in sources if s.project_id == project.id]),
+            "sources_count": source_counts.get(project.id, 0),
         }
         recent_projects.append(project_dict)
 
@@ -89,11 +133,15 @@ async def dashboard(
 async def projects_list(
     request: Request,
     project_repo: Annotated[ProjectRepository, Depends(get_project_repository)],
-) -> HTMLResponse:
+) -> Response:
     """Render projects listing page."""
+    etag = data_version.etag()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _LIST_CACHE_CONTROL})
+
     projects = await project_repo.get_all()
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         request=request,
         name="pages/projects.html",
         context={
@@ -101,6 +149,9 @@ async def projects_list(
             "projects": projects,
         },
     )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _LIST_CACHE_CONTROL
+    return response
 
 
 @router.get("/sources", response_class=HTMLResponse, name="sources_list")
@@ -109,24 +160,36 @@ async def sources_list(
     project_repo: Annotated[ProjectRepository, Depends(get_project_repository)],
     source_repo: Annotated[SourceRepository, Depends(get_source_repository)],
     project: Annotated[str | None, Query()] = None,
-) -> HTMLResponse:
+) -> Response:
     """Render sources listing page."""
-    projects = await project_repo.get_all()
-
+    # One JOIN query returns each source with its project name, so there is
+    # no Python-side patch-up of the frozen Source dataclasses.
     if project:
-        sources = await source_repo.get_by_project(UUID(project))
+        projects, source_pairs = await asyncio.gather(
+            project_repo.get_all(),
+            source_repo.get_by_project_with_project(UUID(project)),
+        )
     else:
-        sources = await source_repo.get_active()
+        projects, source_pairs = await asyncio.gather(
+            project_repo.get_all(),
+            source_repo.get_active_with_project(),
+        )
 
-    # Add project name to each source
-    project_map = {p.id: p.name for p in projects}
-    for source in sources:
-        source.project_name = project_map.get(source.project_id, "Unknown")  # type: ignore[attr-defined]
+    sources = [
+        {
+            "id": source.id,
+            "name": source.name,
+            "source_type": source.source_type,
+            "is_active": source.is_active,
+            "project_name": project_name,
+        }
+        for source, project_name in source_pairs
+    ]
 
-    return templates.TemplateResponse(
-        request=request,
-        name="pages/sources.html",
-        context={
+    return _stream_template(
+        request,
+        "pages/sources.html",
+        {
             "active_page": "sources",
             "projects": projects,
             "sources": sources,
@@ -140,19 +203,24 @@ async def schedules_list(
     request: Request,
     project_repo: Annotated[ProjectRepository, Depends(get_project_repository)],
     schedule_repo: Annotated[ScheduleRepository, Depends(get_schedule_repository)],
-) -> HTMLResponse:
+) -> Response:
     """Render schedules listing page."""
+    etag = data_version.etag()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _LIST_CACHE_CONTROL})
+
     projects = await project_repo.get_all()
     schedules = await schedule_repo.get_active()
 
-    return templates.TemplateResponse(
-        request=request,
-        name="pages/schedules.html",
-        context={
+    return _stream_template(
+        request,
+        "pages/schedules.html",
+        {
             "active_page": "schedules",
             "projects": projects,
             "schedules": schedules,
         },
+        headers={"ETag": etag, "Cache-Control": _LIST_CACHE_CONTROL},
     )
 
 
@@ -162,10 +230,8 @@ async def settings_page(
     settings_repo: Annotated[SettingsRepository, Depends(get_settings_repository)],
 ) -> HTMLResponse:
     """Render settings page."""
-    all_settings = await settings_repo.get_all()
-
-    # Convert to dict for easy access
-    settings_dict = {s.key: s.value for s in all_settings}
+    # The template only needs key/value lookups, so project the mapping in SQL
+    settings_dict = await settings_repo.get_all_map()
 
     return templates.TemplateResponse(
         request=request,
@@ -173,7 +239,6 @@ async def settings_page(
         context={
             "active_page": "settings",
             "settings": settings_dict,
-            "all_settings": all_settings,
             "version": "0.1.0",
         },
     )
@@ -184,13 +249,34 @@ async def settings_page(
 # ============================================================================
 
 
-@api_router.get("/status", response_class=HTMLResponse)
-async def get_status(
-    request: Request,
-    session: Annotated[AsyncSession, Depends(get_session)],
-) -> HTMLResponse:
-    """Return system status for dashboard."""
-    # Check database
+# Status is polled by HTMX every few seconds; cache the probe result briefly
+# so bursts of polls do not each hit the database.
+_STATUS_TTL = 2.0
+
+
+class _StatusCache:
+    """Cached status payload plus a single-flight slot for concurrent misses."""
+
+    __slots__ = ("entry", "inflight")
+
+    def __init__(self) -> None:
+        # (status, etag, expires_at) from the last probe.
+        self.entry: tuple[dict[str, bool], str, float] | None = None
+        # Concurrent cache misses await one shared probe via this future.
+        self.inflight: asyncio.Future[tuple[dict[str, bool], str]] | None = None
+
+
+_status_cache = _StatusCache()
+
+
+def _reset_status_cache() -> None:
+    """Clear the cached status payload (used by tests)."""
+    _status_cache.entry = None
+    _status_cache.inflight = None
+
+
+async def _probe_status(session: AsyncSession) -> dict[str, bool]:
+    """Run the database and bot health checks."""
     db_ok = True
     try:
         await session.execute(text("SELECT 1"))
@@ -200,17 +286,49 @@ async def get_status(
     # Check scheduler and telegram (simplified check)
     bot = get_telegram_bot()
 
-    status = {
+    return {
         "database": db_ok,
         "scheduler": True,  # Assume OK if app is running
         "telegram": bot is not None and bot.is_running,
     }
 
-    return templates.TemplateResponse(
+
+@api_router.get("/status", response_class=HTMLResponse)
+async def get_status(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> Response:
+    """Return system status for dashboard."""
+    cached = _status_cache.entry
+    if cached is not None and cached[2] > time.monotonic():
+        status, etag = cached[0], cached[1]
+    elif _status_cache.inflight is not None:
+        # Another request is already probing; share its result.
+        status, etag = await _status_cache.inflight
+    else:
+        future: asyncio.Future[tuple[dict[str, bool], str]] = asyncio.get_running_loop().create_future()
+        _status_cache.inflight = future
+        try:
+            status = await _probe_status(session)
+            etag = 'W/"{}{}{}"'.format(*(int(v) for v in status.values()))
+            _status_cache.entry = (status, etag, time.monotonic() + _STATUS_TTL)
+            future.set_result((status, etag))
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            _status_cache.inflight = None
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response = templates.TemplateResponse(
         request=request,
         name="components/status.html",
         context={"status": status},
     )
+    response.headers["ETag"] = etag
+    return response
 
 
 # Projects API
@@ -225,6 +343,7 @@ async def create_project(
     """Create a new project via HTMX."""
     try:
         await project_repo.create(name=name, color=color if color else None)
+        data_version.bump()
         return HTMLResponse(content="")
     except IntegrityError:
         return HTMLResponse(
@@ -248,6 +367,7 @@ async def update_project(
     )
 
     if updated:
+        data_version.bump()
         return HTMLResponse(content="")
 
     return HTMLResponse(content="", status_code=404)
@@ -260,37 +380,19 @@ async def delete_project(
 ) -> HTMLResponse:
     """Delete a project via HTMX."""
     await project_repo.delete(project_id)
+    data_version.bump()
     return HTMLResponse(content="")
 
 
 # Sources API
 
 
-def _parse_credentials(form_data: dict[str, Any]) -> dict[str, Any]:
-    """Parse credentials from form data."""
-    credentials: dict[str, Any] = {}
-    for key, value in form_data.items():
-        if key.startswith("credentials.") and value:
-            cred_key = key.replace("credentials.", "")
-            # Try to parse JSON for complex values
-            if cred_key == "credentials_json":
-                try:
-                    credentials[cred_key] = json.loads(value)
-                except json.JSONDecodeError:
-                    credentials[cred_key] = value
-            else:
-                credentials[cred_key] = value
-    return credentials
-
-
-def _parse_config(form_data: dict[str, Any]) -> dict[str, Any]:
-    """Parse config from form data."""
-    config: dict[str, Any] = {}
-    for key, value in form_data.items():
-        if key.startswith("config.") and value:
-            config_key = key.replace("config.", "")
-            config[config_key] = value
-    return config
+_CREDENTIALS_PREFIX = "credentials."
+_CONFIG_PREFIX = "config."
+
+# Value-to-member table built once at import; a dict hit beats the enum
+# constructor's lookup-and-raise path on every POST /sources.
+_SOURCE_TYPE_BY_VALUE: dict[str, SourceType] = {member.value: member for member in SourceType}
 
 
 @api_router.post("/sources", response_class=HTMLResponse)
@@ -300,17 +402,45 @@ async def create_source(
 ) -> HTMLResponse:
     """Create a new source via HTMX."""
     form_data = await request.form()
-    form_dict = dict(form_data)
-
-    project_id = UUID(str(form_dict["project_id"]))
-    source_type_str = str(form_dict["source_type"])
-    name = str(form_dict["name"])
 
-    credentials = _parse_credentials(form_dict)
-    config = _parse_config(form_dict)
+    # Single pass over the form: dispatch prefixed keys into their buckets
+    # and pick the scalar fields, instead of materializing dict(form_data)
+    # and re-scanning it per bucket.
+    project_id: UUID | None = None
+    source_type_str = ""
+    name = ""
+    credentials: dict[str, Any] = {}
+    config: dict[str, Any] = {}
+    cred_len = len(_CREDENTIALS_PREFIX)
+    conf_len = len(_CONFIG_PREFIX)
+    for key, value in form_data.multi_items():
+        if key.startswith(_CREDENTIALS_PREFIX):
+            if value:
+                credentials[key[cred_len:]] = value
+        elif key.startswith(_CONFIG_PREFIX):
+            if value:
+                config[key[conf_len:]] = value
+        elif key == "project_id":
+            project_id = UUID(str(value))
+        elif key == "source_type":
+            source_type_str = str(value)
+        elif key == "name":
+            name = str(value)
+
+    if project_id is None:
+        raise HTTPException(status_code=400, detail="project_id is required")
+
+    # Try to parse JSON for complex values; invalid JSON stays a string
+    raw_json = credentials.get("credentials_json")
+    if isinstance(raw_json, str):
+        with contextlib.suppress(json.JSONDecodeError):
+            credentials["credentials_json"] = json.loads(raw_json)
 
     # Convert string to SourceType enum
-    source_type = SourceType(source_type_str)
+    try:
+        source_type = _SOURCE_TYPE_BY_VALUE[source_type_str]
+    except KeyError:
+        raise HTTPException(status_code=400, detail=f"Unknown source type: {source_type_str}") from None
 
     await source_repo.create(
         project_id=project_id,
@@ -353,6 +483,17 @@ async def delete_source(
     return HTMLResponse(content="")
 
 
+@cache
+def _get_collector(source_type: SourceType) -> Any:
+    """Return a shared collector instance per source type.
+
+    Collectors are stateless (credentials are passed per call), so one
+    instance per type avoids repeated construction on the validation path.
+    """
+    collector_class = CollectorRegistry.get(source_type)
+    return collector_class() if collector_class else None
+
+
 @api_router.post("/sources/{source_id}/test")
 async def test_source_credentials(
     source_id: UUID,
@@ -363,12 +504,11 @@ async def test_source_credentials(
     if not source:
         return {"valid": False, "error": "Source not found"}
 
-    collector_class = CollectorRegistry.get(source.source_type)
-    if not collector_class:
+    collector = _get_collector(source.source_type)
+    if not collector:
         return {"valid": False, "error": "No collector available"}
 
     try:
-        collector = collector_class()
         is_valid = await collector.validate_credentials(source.credentials)
         if is_valid:
             return {"valid": True, "error": None}
@@ -380,26 +520,33 @@ async def test_source_credentials(
 # Schedules API
 
 
+class ScheduleCreateForm(BaseModel):
+    """Form payload for creating a schedule."""
+
+    name: str
+    digest_type: str
+    cron_expression: str
+    timezone: str = "UTC"
+    project_ids: list[UUID] = []
+
+
 @api_router.post("/schedules", response_class=HTMLResponse)
 async def create_schedule(
-    request: Request,
+    data: Annotated[ScheduleCreateForm, Form()],
     schedule_repo: Annotated[ScheduleRepository, Depends(get_schedule_repository)],
 ) -> HTMLResponse:
     """Create a new schedule via HTMX."""
-    form_data = await request.form()
-    form_dict = dict(form_data)
-
-    # Handle project_ids as list
-    project_ids = form_data.getlist("project_ids")
-    project_ids_list = [UUID(str(pid)) for pid in project_ids] if project_ids else None
-
+    # Pydantic parses the multipart form (including repeated project_ids
+    # UUIDs) in its compiled core; bad input becomes a structured 422
+    # instead of a 500 from a manual UUID() loop.
     await schedule_repo.create(
-        name=str(form_dict["name"]),
-        digest_type=str(form_dict["digest_type"]),
-        cron_expression=str(form_dict["cron_expression"]),
-        timezone=str(form_dict.get("timezone", "UTC")),
-        project_ids=project_ids_list,
+        name=data.name,
+        digest_type=data.digest_type,
+        cron_expression=data.cron_expression,
+        timezone=data.timezone,
+        project_ids=data.project_ids or None,
     )
+    data_version.bump()
 
     return HTMLResponse(content="")
 
@@ -424,6 +571,7 @@ async def update_schedule(
     )
 
     if updated:
+        data_version.bump()
         return HTMLResponse(content="")
 
     return HTMLResponse(content="", status_code=404)
@@ -436,6 +584,7 @@ async def delete_schedule(
 ) -> HTMLResponse:
     """Delete a schedule via HTMX."""
     await schedule_repo.delete(schedule_id)
+    data_version.bump()
     return HTMLResponse(content="")
 
 
@@ -444,6 +593,7 @@ async def delete_schedule(
 
 @api_router.post("/settings", response_class=HTMLResponse)
 async def create_setting(
+    request: Request,
     settings_repo: Annotated[SettingsRepository, Depends(get_settings_repository)],
     key: Annotated[str, Form()],
     value: Annotated[str, Form()],
@@ -451,25 +601,11 @@ async def create_setting(
     """Create a new setting via HTMX."""
     await settings_repo.set(key, value)
 
-    return HTMLResponse(
-        content=f"""
-        <div id="setting-{key.replace(".", "-")}" class="row small-padding border-bottom">
-            <div class="max">
-                <p class="bold">{key}</p>
-                <p class="secondary-text small-text">{value[:50]}{"..." if len(value) > 50 else ""}</p>
-            </div>
-            <button class="circle transparent small" onclick="editSetting('{key}', '{value}')">
-                <i>edit</i>
-            </button>
-            <button class="circle transparent small"
-                    hx-delete="/web/api/settings/{key}"
-                    hx-target="#setting-{key.replace(".", "-")}"
-                    hx-swap="outerHTML"
-                    hx-confirm="Delete setting '{key}'?">
-                <i>delete</i>
-            </button>
-        </div>
-        """
+    # Rendered as a cached, autoescaped Jinja partial instead of an f-string
+    return templates.TemplateResponse(
+        request=request,
+        name="components/setting_row.html",
+        context={"key": key, "value": value},
     )
 
 
@@ -502,8 +638,9 @@ async def batch_update_settings(
     """Update multiple settings at once via HTMX."""
     form_data = await request.form()
 
-    for key, value in form_data.items():
-        if value:  # Only save non-empty values
-            await settings_repo.set(key, str(value))
+    # Only save non-empty values, all in one upsert statement
+    updates = {key: str(value) for key, value in form_data.items() if value}
+    if updates:
+        await settings_repo.set_many(updates)
 
     return HTMLResponse(content="")
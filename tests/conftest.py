@@ -1,38 +1,79 @@
 """Pytest configuration and fixtures."""
 
 import os
+import sys
 from collections.abc import AsyncGenerator
+from typing import Any
 
+import orjson
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import pytest_asyncio
+from httpx import Response
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
 
 from axela.infrastructure.database.models import Base
 
+# Test runs are short-lived; skip writing .pyc files for modules
+# imported after this point (CI also sets PYTHONDONTWRITEBYTECODE).
+sys.dont_write_bytecode = True
+
 # Set test environment variables before importing settings
 os.environ.setdefault("AXELA_TELEGRAM_BOT_TOKEN", "test-bot-token")
 os.environ.setdefault("AXELA_ENCRYPTION_KEY", "test-encryption-key-32-bytes-ok")
 os.environ.setdefault("AXELA_DATABASE_URL", "sqlite+aiosqlite:///:memory:")
 
 
-@pytest.fixture
-async def async_session() -> AsyncGenerator[AsyncSession]:
-    """Create an async session for testing with in-memory SQLite."""
-    # Use SQLite for testing
+def parse_body(response: Response) -> Any:
+    """Decode a response body with orjson.
+
+    Cheaper than ``response.json()`` for the thousands of small payload
+    assertions the API tests make.
+    """
+    return orjson.loads(response.content)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_engine() -> AsyncGenerator[AsyncEngine]:
+    """Create an in-memory SQLite engine shared across the test session.
+
+    The schema is created once; per-test isolation is handled by the
+    transaction rollback in ``async_session``. ``StaticPool`` keeps a
+    single shared connection so the in-memory database persists.
+    """
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
     )
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    session_factory = async_sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-
-    async with session_factory() as session:
-        yield session
+    yield engine
 
     await engine.dispose()
+
+
+# Configured once at import; per-test fixtures only bind a connection.
+_session_factory = async_sessionmaker(class_=AsyncSession, expire_on_commit=False, autoflush=False)
+
+
+@pytest.fixture
+async def async_session(async_engine: AsyncEngine) -> AsyncGenerator[AsyncSession]:
+    """Create an async session wrapped in a per-test transaction."""
+    async with async_engine.connect() as conn:
+        transaction = await conn.begin()
+        session = _session_factory(bind=conn)
+        try:
+            yield session
+        finally:
+            await session.close()
+            if transaction.is_active:
+                await transaction.rollback()
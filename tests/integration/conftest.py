@@ -7,12 +7,14 @@ from typing import Any, ClassVar
 from uuid import UUID, uuid4
 
 import pytest
+import pytest_asyncio
 from sqlalchemy import (
     JSON,
     Boolean,
     DateTime,
     ForeignKey,
     Integer,
+    LargeBinary,
     String,
     Text,
     TypeDecorator,
@@ -20,28 +22,30 @@ from sqlalchemy import (
     event,
 )
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.pool import StaticPool
 
 
-class UUIDString(TypeDecorator[UUID]):
-    """Platform-independent UUID type that uses String storage for SQLite."""
+class UUIDBinary(TypeDecorator[UUID]):
+    """Platform-independent UUID type that uses 16-byte BLOB storage for SQLite."""
 
-    impl = String(36)
+    impl = LargeBinary(16)
     cache_ok = True
 
-    def process_bind_param(self, value: UUID | None, dialect: Any) -> str | None:
+    def process_bind_param(self, value: UUID | None, dialect: Any) -> bytes | None:
         if value is not None:
-            return str(value)
+            return value.bytes
         return value
 
-    def process_result_value(self, value: str | None, dialect: Any) -> UUID | None:
+    def process_result_value(self, value: bytes | None, dialect: Any) -> UUID | None:
         if value is not None:
-            return UUID(value)
+            return UUID(bytes=value)
         return value
 
 
@@ -68,11 +72,15 @@ class SQLiteBase(DeclarativeBase):
     type_annotation_map: ClassVar[dict[type, Any]] = {
         dict[str, Any]: JSON,
         list[UUID]: JSONList,
-        UUID: UUIDString,
+        UUID: UUIDBinary,
     }
 
 
 # SQLite-compatible models (using SQLite prefix to avoid pytest collection)
+#
+# Note: the ``default=uuid4`` / ``default=lambda: datetime.now(UTC)`` column
+# defaults are applied by SQLAlchemy during flush, not at construction, so
+# tests asserting ``row.id``/``row.created_at`` must flush first.
 
 
 class SQLiteProjectModel(SQLiteBase):
@@ -80,7 +88,7 @@ class SQLiteProjectModel(SQLiteBase):
 
     __tablename__ = "projects"
 
-    id: Mapped[UUID] = mapped_column(UUIDString, primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(UUIDBinary, primary_key=True, default=uuid4)
     name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
     color: Mapped[str | None] = mapped_column(String(7))
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(UTC))
@@ -93,8 +101,8 @@ class SQLiteSourceModel(SQLiteBase):
 
     __tablename__ = "sources"
 
-    id: Mapped[UUID] = mapped_column(UUIDString, primary_key=True, default=uuid4)
-    project_id: Mapped[UUID] = mapped_column(UUIDString, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    id: Mapped[UUID] = mapped_column(UUIDBinary, primary_key=True, default=uuid4)
+    project_id: Mapped[UUID] = mapped_column(UUIDBinary, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     source_type: Mapped[str] = mapped_column(String(50), nullable=False)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     credentials: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
@@ -116,8 +124,8 @@ class SQLiteItemModel(SQLiteBase):
     __tablename__ = "items"
     __table_args__ = (UniqueConstraint("source_id", "external_id", name="uq_items_source_external"),)
 
-    id: Mapped[UUID] = mapped_column(UUIDString, primary_key=True, default=uuid4)
-    source_id: Mapped[UUID] = mapped_column(UUIDString, ForeignKey("sources.id", ondelete="CASCADE"), nullable=False)
+    id: Mapped[UUID] = mapped_column(UUIDBinary, primary_key=True, default=uuid4)
+    source_id: Mapped[UUID] = mapped_column(UUIDBinary, ForeignKey("sources.id", ondelete="CASCADE"), nullable=False)
     external_id: Mapped[str] = mapped_column(String(255), nullable=False)
     item_type: Mapped[str] = mapped_column(String(50), nullable=False)
     title: Mapped[str | None] = mapped_column(Text)
@@ -140,7 +148,7 @@ class SQLiteDigestModel(SQLiteBase):
 
     __tablename__ = "digests"
 
-    id: Mapped[UUID] = mapped_column(UUIDString, primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(UUIDBinary, primary_key=True, default=uuid4)
     digest_type: Mapped[str] = mapped_column(String(20), nullable=False)
     scheduled_at: Mapped[datetime | None] = mapped_column(DateTime)
     sent_at: Mapped[datetime | None] = mapped_column(DateTime)
@@ -162,9 +170,9 @@ class SQLiteDigestItemModel(SQLiteBase):
     __tablename__ = "digest_items"
     __table_args__ = (UniqueConstraint("digest_id", "item_id", name="uq_digest_items"),)
 
-    id: Mapped[UUID] = mapped_column(UUIDString, primary_key=True, default=uuid4)
-    digest_id: Mapped[UUID] = mapped_column(UUIDString, ForeignKey("digests.id", ondelete="CASCADE"), nullable=False)
-    item_id: Mapped[UUID] = mapped_column(UUIDString, ForeignKey("items.id", ondelete="CASCADE"), nullable=False)
+    id: Mapped[UUID] = mapped_column(UUIDBinary, primary_key=True, default=uuid4)
+    digest_id: Mapped[UUID] = mapped_column(UUIDBinary, ForeignKey("digests.id", ondelete="CASCADE"), nullable=False)
+    item_id: Mapped[UUID] = mapped_column(UUIDBinary, ForeignKey("items.id", ondelete="CASCADE"), nullable=False)
     content_hash_at_send: Mapped[str] = mapped_column(String(64), nullable=False)
 
     digest: Mapped["SQLiteDigestModel"] = relationship(back_populates="digest_items")
@@ -176,7 +184,7 @@ class SQLiteScheduleModel(SQLiteBase):
 
     __tablename__ = "schedules"
 
-    id: Mapped[UUID] = mapped_column(UUIDString, primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(UUIDBinary, primary_key=True, default=uuid4)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     digest_type: Mapped[str] = mapped_column(String(20), nullable=False)
     cron_expression: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -191,8 +199,8 @@ class SQLiteCollectorErrorModel(SQLiteBase):
 
     __tablename__ = "collector_errors"
 
-    id: Mapped[UUID] = mapped_column(UUIDString, primary_key=True, default=uuid4)
-    source_id: Mapped[UUID] = mapped_column(UUIDString, ForeignKey("sources.id", ondelete="CASCADE"), nullable=False)
+    id: Mapped[UUID] = mapped_column(UUIDBinary, primary_key=True, default=uuid4)
+    source_id: Mapped[UUID] = mapped_column(UUIDBinary, ForeignKey("sources.id", ondelete="CASCADE"), nullable=False)
     error_type: Mapped[str | None] = mapped_column(String(100))
     error_message: Mapped[str | None] = mapped_column(Text)
     resolved: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -211,19 +219,38 @@ class SQLiteSettingModel(SQLiteBase):
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(UTC))
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def sqlite_engine() -> AsyncGenerator[AsyncEngine]:
-    """Create SQLite in-memory async engine."""
+    """Create a SQLite in-memory async engine shared across the test session.
+
+    The schema is created once; tests isolate themselves via per-test
+    transactions in ``sqlite_session``. ``StaticPool`` pins a single
+    connection so the in-memory database survives for the engine's
+    lifetime without per-test reconnects.
+    """
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
     )
 
-    # Enable foreign keys for SQLite
+    # Enable foreign keys and throughput-oriented pragmas for SQLite.
+    # The single StaticPool connection never shares the database, so the
+    # journal can live in memory with syncing off and exclusive locking;
+    # durability is irrelevant for a throwaway test database.
     @event.listens_for(engine.sync_engine, "connect")
     def set_sqlite_pragma(dbapi_connection: Any, _connection_record: Any) -> None:
         cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
+        for pragma in (
+            "foreign_keys=ON",
+            "journal_mode=MEMORY",
+            "synchronous=OFF",
+            "temp_store=MEMORY",
+            "locking_mode=EXCLUSIVE",
+            "cache_size=-64000",
+        ):
+            cursor.execute(f"PRAGMA {pragma}")
         cursor.close()
 
     async with engine.begin() as conn:
@@ -234,16 +261,44 @@ async def sqlite_engine() -> AsyncGenerator[AsyncEngine]:
     await engine.dispose()
 
 
-@pytest.fixture
-async def sqlite_session(sqlite_engine: AsyncEngine) -> AsyncGenerator[AsyncSession]:
-    """Create SQLite async session."""
-    session_factory = async_sessionmaker(
-        sqlite_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autoflush=False,
-    )
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def sqlite_connection(sqlite_engine: AsyncEngine) -> AsyncGenerator[AsyncConnection]:
+    """Keep one connection and one outer transaction open for the whole run.
+
+    Nothing is ever committed on the connection, so SQLite never touches
+    its journal; tests isolate themselves with SAVEPOINTs underneath.
+    """
+    async with sqlite_engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            yield conn
+        finally:
+            if transaction.is_active:
+                await transaction.rollback()
+
+
+# Configured once at import; per-test fixtures only bind a connection.
+_session_factory = async_sessionmaker(
+    class_=AsyncSession,
+    join_transaction_mode="create_savepoint",
+    expire_on_commit=False,
+    autoflush=False,
+)
+
 
-    async with session_factory() as session:
+@pytest.fixture
+async def sqlite_session(sqlite_connection: AsyncConnection) -> AsyncGenerator[AsyncSession]:
+    """Create a SQLite async session wrapped in a per-test SAVEPOINT.
+
+    The session joins the connection's long-lived transaction; its own
+    commits become nested SAVEPOINTs and the teardown rollback gives each
+    test a clean database without re-running DDL or reconnecting.
+    """
+    nested = await sqlite_connection.begin_nested()
+    session = _session_factory(bind=sqlite_connection)
+    try:
         yield session
-        await session.rollback()
+    finally:
+        await session.close()
+        if nested.is_active:
+            await nested.rollback()
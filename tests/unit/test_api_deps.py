@@ -1,21 +1,53 @@
 """Tests for FastAPI dependencies."""
 
+import asyncio
 import contextlib
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
+from axela.api import deps
 from axela.api.deps import (
     _AppState,
+    _state,
     get_error_alert_service,
     get_message_bus,
     get_scheduler,
+    get_session,
     get_telegram_bot,
     set_error_alert_service,
     set_message_bus,
     set_scheduler,
     set_telegram_bot,
 )
+from axela.infrastructure.database import repository
+from axela.infrastructure.database.session import get_async_session_factory
+
+
+@pytest.fixture(autouse=True)
+def _snapshot_app_state() -> Generator[None]:
+    """Snapshot and restore the shared application state around each test.
+
+    Replaces the per-test cleanup setter calls and keeps state from
+    leaking between tests regardless of how a test exits.
+    """
+    saved = (
+        _state.message_bus,
+        _state.telegram_bot,
+        _state.error_alert_service,
+        _state.scheduler,
+    )
+    yield
+    (
+        _state.message_bus,
+        _state.telegram_bot,
+        _state.error_alert_service,
+        _state.scheduler,
+    ) = saved
 
 
 class TestAppState:
@@ -48,9 +80,6 @@ class TestMessageBus:
         result = get_message_bus()
         assert result == mock_bus
 
-        # Cleanup
-        set_message_bus(None)  # type: ignore[arg-type]
-
 
 class TestTelegramBot:
     """Tests for telegram bot getter/setter."""
@@ -69,9 +98,6 @@ class TestTelegramBot:
         result = get_telegram_bot()
         assert result == mock_bot
 
-        # Cleanup
-        set_telegram_bot(None)
-
 
 class TestErrorAlertService:
     """Tests for error alert service getter/setter."""
@@ -90,9 +116,6 @@ class TestErrorAlertService:
         result = get_error_alert_service()
         assert result == mock_service
 
-        # Cleanup
-        set_error_alert_service(None)
-
 
 class TestScheduler:
     """Tests for scheduler getter/setter."""
@@ -111,134 +134,98 @@ class TestScheduler:
         result = get_scheduler()
         assert result == mock_scheduler
 
-        # Cleanup
-        set_scheduler(None)
 
+@pytest.fixture(scope="module")
+def runner() -> Generator[asyncio.Runner]:
+    """Share one event loop for the mock-only session tests.
 
-class TestGetSession:
-    """Tests for database session dependency."""
-
-    @pytest.mark.asyncio
-    async def test_get_session_commit_on_success(self) -> None:
-        """Test session commits on successful operations."""
-        mock_session = AsyncMock()
+    These tests only drive AsyncMocks, so the per-test loop that
+    pytest-asyncio would build is pure overhead.
+    """
+    with asyncio.Runner() as loop_runner:
+        yield loop_runner
 
-        with patch("axela.api.deps.get_async_session_factory") as mock_factory:
-            mock_session_cm = AsyncMock()
-            mock_session_cm.__aenter__.return_value = mock_session
-            mock_session_cm.__aexit__.return_value = None
-            mock_factory.return_value = MagicMock(return_value=mock_session_cm)
 
-            from axela.api.deps import get_session
+@pytest.fixture
+def transaction_events() -> Generator[list[str]]:
+    """Record commit/rollback on the real (in-memory SQLite) engine.
 
-            async for _session in get_session():
-                # Use the session
-                pass
+    Driving ``get_session`` against the real engine avoids the
+    AsyncMock context-manager tower the tests used to build, and
+    engine-level events observe exactly what reaches the database.
+    """
+    engine: AsyncEngine = get_async_session_factory().kw["bind"]
+    events: list[str] = []
 
-            mock_session.commit.assert_called_once()
+    def on_commit(_conn: Any) -> None:
+        events.append("commit")
 
-    @pytest.mark.asyncio
-    async def test_get_session_rollback_on_exception(self) -> None:
-        """Test session rolls back on exception."""
-        mock_session = AsyncMock()
-
-        with patch("axela.api.deps.get_async_session_factory") as mock_factory:
-            mock_session_cm = AsyncMock()
-            mock_session_cm.__aenter__.return_value = mock_session
-            mock_session_cm.__aexit__.return_value = None
-            mock_factory.return_value = MagicMock(return_value=mock_session_cm)
-
-            from axela.api.deps import get_session
-
-            gen = get_session()
-            try:
-                await gen.__anext__()
-                # Simulate an exception
-                raise ValueError("Test error")
-            except ValueError:
-                # Cleanup the generator by throwing into it
-                with contextlib.suppress(ValueError):
-                    await gen.athrow(ValueError, ValueError("Test error"), None)
-
-            mock_session.rollback.assert_called_once()
-
-
-class TestRepositoryDependencies:
-    """Tests for repository dependency functions."""
+    def on_rollback(_conn: Any) -> None:
+        events.append("rollback")
 
-    def test_get_project_repository(self) -> None:
-        """Test project repository dependency creation."""
-        mock_session = MagicMock()
+    event.listen(engine.sync_engine, "commit", on_commit)
+    event.listen(engine.sync_engine, "rollback", on_rollback)
+    yield events
+    event.remove(engine.sync_engine, "commit", on_commit)
+    event.remove(engine.sync_engine, "rollback", on_rollback)
 
-        from axela.api.deps import get_project_repository
-        from axela.infrastructure.database.repository import ProjectRepositoryImpl
 
-        result = get_project_repository(mock_session)
-
-        assert isinstance(result, ProjectRepositoryImpl)
-
-    def test_get_source_repository(self) -> None:
-        """Test source repository dependency creation."""
-        mock_session = MagicMock()
-
-        from axela.api.deps import get_source_repository
-        from axela.infrastructure.database.repository import SourceRepositoryImpl
-
-        result = get_source_repository(mock_session)
-
-        assert isinstance(result, SourceRepositoryImpl)
-
-    def test_get_item_repository(self) -> None:
-        """Test item repository dependency creation."""
-        mock_session = MagicMock()
-
-        from axela.api.deps import get_item_repository
-        from axela.infrastructure.database.repository import ItemRepositoryImpl
-
-        result = get_item_repository(mock_session)
-
-        assert isinstance(result, ItemRepositoryImpl)
-
-    def test_get_digest_repository(self) -> None:
-        """Test digest repository dependency creation."""
-        mock_session = MagicMock()
-
-        from axela.api.deps import get_digest_repository
-        from axela.infrastructure.database.repository import DigestRepositoryImpl
-
-        result = get_digest_repository(mock_session)
-
-        assert isinstance(result, DigestRepositoryImpl)
+class TestGetSession:
+    """Tests for database session dependency."""
 
-    def test_get_schedule_repository(self) -> None:
-        """Test schedule repository dependency creation."""
-        mock_session = MagicMock()
+    def test_get_session_commit_on_success(self, runner: asyncio.Runner, transaction_events: list[str]) -> None:
+        """Test session commits on successful operations."""
 
-        from axela.api.deps import get_schedule_repository
-        from axela.infrastructure.database.repository import ScheduleRepositoryImpl
+        async def _impl() -> None:
+            async for session in get_session():
+                # Touch the database so a transaction is actually open
+                await session.execute(text("SELECT 1"))
 
-        result = get_schedule_repository(mock_session)
+        runner.run(_impl())
+        assert transaction_events == ["commit"]
 
-        assert isinstance(result, ScheduleRepositoryImpl)
+    def test_get_session_rollback_on_exception(self, runner: asyncio.Runner, transaction_events: list[str]) -> None:
+        """Test session rolls back on exception."""
 
-    def test_get_error_repository(self) -> None:
-        """Test collector error repository dependency creation."""
-        mock_session = MagicMock()
+        async def _impl() -> None:
+            gen = get_session()
+            session = await gen.__anext__()
+            await session.execute(text("SELECT 1"))
+            # Cleanup the generator by throwing into it
+            with contextlib.suppress(ValueError):
+                await gen.athrow(ValueError("Test error"))
 
-        from axela.api.deps import get_error_repository
-        from axela.infrastructure.database.repository import CollectorErrorRepositoryImpl
+        runner.run(_impl())
+        assert transaction_events == ["rollback"]
 
-        result = get_error_repository(mock_session)
 
-        assert isinstance(result, CollectorErrorRepositoryImpl)
+@pytest.fixture(scope="module")
+def session_mock() -> MagicMock:
+    """Share one session stand-in across the dependency tests.
 
-    def test_get_settings_repository(self) -> None:
-        """Test settings repository dependency creation."""
-        mock_session = MagicMock()
+    None of them mutate it, and spec'ing against AsyncSession keeps the
+    mock's attribute surface small.
+    """
+    return MagicMock(spec=AsyncSession)
 
-        from axela.api.deps import get_settings_repository
-        from axela.infrastructure.database.repository import SettingsRepositoryImpl
 
-        result = get_settings_repository(mock_session)
+class TestRepositoryDependencies:
+    """Tests for repository dependency functions."""
 
-        assert isinstance(result, SettingsRepositoryImpl)
+    @pytest.mark.parametrize(
+        ("getter_name", "impl_name"),
+        [
+            ("get_project_repository", "ProjectRepositoryImpl"),
+            ("get_source_repository", "SourceRepositoryImpl"),
+            ("get_item_repository", "ItemRepositoryImpl"),
+            ("get_digest_repository", "DigestRepositoryImpl"),
+            ("get_schedule_repository", "ScheduleRepositoryImpl"),
+            ("get_error_repository", "CollectorErrorRepositoryImpl"),
+            ("get_settings_repository", "SettingsRepositoryImpl"),
+        ],
+    )
+    def test_repository_dependency(self, getter_name: str, impl_name: str, session_mock: MagicMock) -> None:
+        """Test each repository dependency returns its implementation type."""
+        result = getattr(deps, getter_name)(session_mock)
+
+        assert isinstance(result, getattr(repository, impl_name))
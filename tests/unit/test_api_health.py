@@ -1,42 +1,48 @@
 """Tests for Health API routes."""
 
-from collections.abc import AsyncGenerator
-from unittest.mock import AsyncMock, MagicMock
+from collections.abc import AsyncGenerator, Generator
+from typing import Any
 
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
+from axela.api.deps import set_scheduler
 from axela.api.routes.health import router
+from axela.infrastructure.database import get_async_session
+from tests.conftest import parse_body
 
 
-@pytest.fixture
-def mock_session() -> AsyncMock:
-    """Return mock database session."""
-    session = AsyncMock()
-    session.execute = AsyncMock()
-    return session
+class FakeSession:
+    """Minimal async-session stand-in for the readiness probe."""
 
+    def __init__(self) -> None:
+        self.error: Exception | None = None
 
-@pytest.fixture
-def mock_scheduler() -> MagicMock:
-    """Return mock scheduler."""
-    scheduler = MagicMock()
-    scheduler.is_running = True
-    return scheduler
+    async def execute(self, _stmt: Any) -> None:
+        if self.error is not None:
+            raise self.error
 
 
-@pytest.fixture
+class FakeScheduler:
+    """Scheduler stand-in exposing only the probed attribute."""
+
+    def __init__(self) -> None:
+        self.is_running = True
+
+
+@pytest.fixture(scope="module")
 def app() -> FastAPI:
-    """Create test FastAPI app."""
+    """Create test FastAPI app shared across the module."""
     app = FastAPI()
     app.include_router(router)
     return app
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def client(app: FastAPI) -> AsyncGenerator[AsyncClient]:
-    """Create async test client."""
+    """Create async test client shared across the module."""
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
@@ -44,10 +50,16 @@ async def client(app: FastAPI) -> AsyncGenerator[AsyncClient]:
         yield client
 
 
+@pytest.fixture(autouse=True)
+def _clear_overrides(app: FastAPI) -> Generator[None]:
+    """Drop dependency overrides so mocks never leak between tests."""
+    yield
+    app.dependency_overrides.clear()
+
+
 class TestHealthCheck:
     """Tests for GET /health."""
 
-    @pytest.mark.asyncio
     async def test_health_check_returns_ok(
         self,
         client: AsyncClient,
@@ -56,11 +68,10 @@ class TestHealthCheck:
         response = await client.get("/health")
 
         assert response.status_code == 200
-        data = response.json()
+        data = parse_body(response)
         assert data["status"] == "ok"
         assert "version" in data
 
-    @pytest.mark.asyncio
     async def test_health_check_includes_version(
         self,
         client: AsyncClient,
@@ -69,7 +80,7 @@ class TestHealthCheck:
         response = await client.get("/health")
 
         assert response.status_code == 200
-        data = response.json()
+        data = parse_body(response)
         # Version should be a string
         assert isinstance(data["version"], str)
 
@@ -77,144 +88,69 @@ class TestHealthCheck:
 class TestReadinessCheck:
     """Tests for GET /health/ready."""
 
-    @pytest.mark.asyncio
-    async def test_readiness_all_ok(
-        self,
-        app: FastAPI,
-        mock_session: AsyncMock,
-        mock_scheduler: MagicMock,
-    ) -> None:
-        """Test readiness check when all components are healthy."""
-        # Override dependencies
-        from axela.api.deps import set_scheduler
-        from axela.infrastructure.database import get_async_session
-
-        app.dependency_overrides[get_async_session] = lambda: mock_session
-        set_scheduler(mock_scheduler)
-
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            response = await client.get("/health/ready")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "ok"
-        assert data["database"] == "ok"
-        assert data["scheduler"] == "ok"
-
-        # Cleanup
-        set_scheduler(None)
-
-    @pytest.mark.asyncio
-    async def test_readiness_database_error(
-        self,
-        app: FastAPI,
-        mock_session: AsyncMock,
-        mock_scheduler: MagicMock,
-    ) -> None:
-        """Test readiness check when database fails."""
-        mock_session.execute.side_effect = Exception("Database connection failed")
-
-        from axela.api.deps import set_scheduler
-        from axela.infrastructure.database import get_async_session
-
-        app.dependency_overrides[get_async_session] = lambda: mock_session
-        set_scheduler(mock_scheduler)
-
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            response = await client.get("/health/ready")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "degraded"
-        assert "error" in data["database"]
-        assert "Database connection failed" in data["database"]
-
-        # Cleanup
-        set_scheduler(None)
-
-    @pytest.mark.asyncio
-    async def test_readiness_scheduler_not_configured(
-        self,
-        app: FastAPI,
-        mock_session: AsyncMock,
-    ) -> None:
-        """Test readiness check when scheduler is not configured."""
-        from axela.api.deps import set_scheduler
-        from axela.infrastructure.database import get_async_session
-
-        app.dependency_overrides[get_async_session] = lambda: mock_session
-        set_scheduler(None)
-
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            response = await client.get("/health/ready")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "degraded"
-        assert data["scheduler"] == "not configured"
-
-    @pytest.mark.asyncio
-    async def test_readiness_scheduler_stopped(
-        self,
-        app: FastAPI,
-        mock_session: AsyncMock,
-        mock_scheduler: MagicMock,
-    ) -> None:
-        """Test readiness check when scheduler is stopped."""
-        mock_scheduler.is_running = False
-
-        from axela.api.deps import set_scheduler
-        from axela.infrastructure.database import get_async_session
-
-        app.dependency_overrides[get_async_session] = lambda: mock_session
-        set_scheduler(mock_scheduler)
-
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            response = await client.get("/health/ready")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "degraded"
-        assert data["scheduler"] == "stopped"
-
-        # Cleanup
+    @pytest.fixture(autouse=True)
+    def _reset_scheduler(self) -> Generator[None]:
+        """Clear the scheduler set by a test so state never leaks."""
+        yield
         set_scheduler(None)
 
-    @pytest.mark.asyncio
-    async def test_readiness_all_failed(
+    # The five scenarios share one body; only the fake state and the
+    # expected payload vary.
+    @pytest.mark.parametrize(
+        ("db_error", "scheduler_state", "expected"),
+        [
+            pytest.param(None, "running", {"status": "ok", "database": "ok", "scheduler": "ok"}, id="all-ok"),
+            pytest.param(
+                "Database connection failed",
+                "running",
+                {"status": "degraded", "scheduler": "ok"},
+                id="database-error",
+            ),
+            pytest.param(
+                None,
+                None,
+                {"status": "degraded", "database": "ok", "scheduler": "not configured"},
+                id="scheduler-not-configured",
+            ),
+            pytest.param(
+                None,
+                "stopped",
+                {"status": "degraded", "database": "ok", "scheduler": "stopped"},
+                id="scheduler-stopped",
+            ),
+            pytest.param(
+                "DB down",
+                None,
+                {"status": "degraded", "scheduler": "not configured"},
+                id="all-failed",
+            ),
+        ],
+    )
+    async def test_readiness(
         self,
         app: FastAPI,
-        mock_session: AsyncMock,
+        client: AsyncClient,
+        db_error: str | None,
+        scheduler_state: str | None,
+        expected: dict[str, str],
     ) -> None:
-        """Test readiness check when all components fail."""
-        mock_session.execute.side_effect = Exception("DB down")
-
-        from axela.api.deps import set_scheduler
-        from axela.infrastructure.database import get_async_session
+        """Test readiness across database/scheduler health combinations."""
+        session = FakeSession()
+        if db_error is not None:
+            session.error = Exception(db_error)
+        app.dependency_overrides[get_async_session] = lambda: session
 
-        app.dependency_overrides[get_async_session] = lambda: mock_session
-        set_scheduler(None)
+        if scheduler_state is not None:
+            scheduler = FakeScheduler()
+            scheduler.is_running = scheduler_state == "running"
+            set_scheduler(scheduler)
 
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            response = await client.get("/health/ready")
+        response = await client.get("/health/ready")
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "degraded"
-        assert "error" in data["database"]
-        assert data["scheduler"] == "not configured"
+        data = parse_body(response)
+        for key, value in expected.items():
+            assert data[key] == value
+        if db_error is not None:
+            assert "error" in data["database"]
+            assert db_error in data["database"]
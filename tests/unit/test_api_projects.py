@@ -1,52 +1,102 @@
 """Tests for Projects API routes."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock
-from uuid import uuid4
+from typing import Any
+from uuid import UUID, uuid4
 
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
+from axela.api.deps import get_project_repository
 from axela.api.routes.projects import router
 from axela.domain.models import Project
-
-
-@pytest.fixture
-def mock_project_repo() -> AsyncMock:
-    """Return mock project repository."""
-    return AsyncMock()
-
-
-@pytest.fixture
+from tests.conftest import parse_body
+
+_FIXED_DT = datetime(2025, 1, 1, tzinfo=UTC)
+
+# Prototype rows for list-shape tests; built once at import since the
+# tests only assert on response length.
+_THREE_PROJECTS = [Project(id=uuid4(), name=f"Project {i}", color=None, created_at=_FIXED_DT) for i in range(3)]
+
+_SAMPLE_PROJECT = Project(
+    id=uuid4(),
+    name="Test Project",
+    color="#FF5733",
+    created_at=_FIXED_DT,
+)
+_UPDATED_PROJECT = Project(
+    id=_SAMPLE_PROJECT.id,
+    name="Updated Name",
+    color="#00FF00",
+    created_at=_SAMPLE_PROJECT.created_at,
+)
+_SAMPLE_PATH = f"/api/v1/projects/{_SAMPLE_PROJECT.id}"
+# The not-found tests never dereference this id, so one is enough.
+_DUMMY_PATH = f"/api/v1/projects/{uuid4()}"
+
+
+class FakeProjectRepo:
+    """Hand-rolled ProjectRepository stand-in with canned returns and recorded calls."""
+
+    def __init__(self) -> None:
+        self.by_name: Project | None = None
+        self.created: Project | None = None
+        self.all_projects: list[Project] = []
+        self.by_id: Project | None = None
+        self.updated: Project | None = None
+        self.deleted = False
+        self.create_calls: list[dict[str, Any]] = []
+
+    async def get_by_name(self, name: str) -> Project | None:
+        return self.by_name
+
+    async def create(self, **kwargs: Any) -> Project | None:
+        self.create_calls.append(kwargs)
+        return self.created
+
+    async def get_all(self) -> list[Project]:
+        return self.all_projects
+
+    async def get_by_id(self, project_id: UUID) -> Project | None:
+        return self.by_id
+
+    async def update(self, project_id: UUID, **kwargs: Any) -> Project | None:
+        return self.updated
+
+    async def delete(self, project_id: UUID) -> bool:
+        return self.deleted
+
+
+# The domain models are frozen dataclasses, so one instance can be
+# shared by every test in the module.
+@pytest.fixture(scope="module")
 def sample_project() -> Project:
     """Return sample project."""
-    return Project(
-        id=uuid4(),
-        name="Test Project",
-        color="#FF5733",
-        created_at=datetime.now(UTC),
-    )
+    return _SAMPLE_PROJECT
 
 
-@pytest.fixture
-def app(mock_project_repo: AsyncMock) -> FastAPI:
-    """Create test FastAPI app with mocked dependencies."""
+@pytest.fixture(scope="module")
+def app() -> FastAPI:
+    """Create test FastAPI app shared across the module."""
     app = FastAPI()
     app.include_router(router, prefix="/api/v1")
-
-    # Override the dependency
-    from axela.api.deps import get_project_repository
-
-    app.dependency_overrides[get_project_repository] = lambda: mock_project_repo
-
     return app
 
 
 @pytest.fixture
+def mock_project_repo(app: FastAPI) -> FakeProjectRepo:
+    """Return fake project repository wired into the shared app."""
+    repo = FakeProjectRepo()
+    app.dependency_overrides[get_project_repository] = lambda: repo
+    return repo
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def client(app: FastAPI) -> AsyncGenerator[AsyncClient]:
-    """Create async test client."""
+    """Create async test client shared across the module."""
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
@@ -54,40 +104,140 @@ async def client(app: FastAPI) -> AsyncGenerator[AsyncClient]:
         yield client
 
 
-class TestCreateProject:
-    """Tests for POST /api/v1/projects."""
-
-    @pytest.mark.asyncio
-    async def test_create_project_success(
+@pytest.fixture(autouse=True)
+def _clear_overrides(app: FastAPI) -> Generator[None]:
+    """Drop dependency overrides so mocks never leak between tests."""
+    yield
+    app.dependency_overrides.clear()
+
+
+class TestProjectCrud:
+    """Table-driven tests for the project CRUD happy and not-found paths."""
+
+    @pytest.mark.parametrize(
+        ("method", "path", "body", "repo_state", "expected_status", "expected_fields", "expected_create_calls"),
+        [
+            pytest.param(
+                "post",
+                "/api/v1/projects",
+                {"name": "Test Project", "color": "#FF5733"},
+                {"created": _SAMPLE_PROJECT},
+                201,
+                {"name": "Test Project", "color": "#FF5733"},
+                [{"name": "Test Project", "color": "#FF5733"}],
+                id="create-success",
+            ),
+            pytest.param(
+                "get",
+                _SAMPLE_PATH,
+                None,
+                {"by_id": _SAMPLE_PROJECT},
+                200,
+                {"id": str(_SAMPLE_PROJECT.id), "name": "Test Project"},
+                None,
+                id="get-success",
+            ),
+            pytest.param(
+                "get",
+                _DUMMY_PATH,
+                None,
+                {},
+                404,
+                {"detail": "Project not found"},
+                None,
+                id="get-not-found",
+            ),
+            pytest.param(
+                "patch",
+                _SAMPLE_PATH,
+                {"name": "Updated Name", "color": "#00FF00"},
+                {"updated": _UPDATED_PROJECT},
+                200,
+                {"name": "Updated Name", "color": "#00FF00"},
+                None,
+                id="update-success",
+            ),
+            pytest.param(
+                "patch",
+                _DUMMY_PATH,
+                {"name": "New Name"},
+                {},
+                404,
+                {"detail": "Project not found"},
+                None,
+                id="update-not-found",
+            ),
+            pytest.param(
+                "patch",
+                _SAMPLE_PATH,
+                {"name": _SAMPLE_PROJECT.name},
+                {"by_name": _SAMPLE_PROJECT, "updated": _SAMPLE_PROJECT},
+                200,
+                None,
+                None,
+                id="update-same-name-same-project",
+            ),
+            pytest.param(
+                "delete",
+                _DUMMY_PATH,
+                None,
+                {"deleted": True},
+                204,
+                None,
+                None,
+                id="delete-success",
+            ),
+            pytest.param(
+                "delete",
+                _DUMMY_PATH,
+                None,
+                {},
+                404,
+                {"detail": "Project not found"},
+                None,
+                id="delete-not-found",
+            ),
+        ],
+    )
+    async def test_project_crud(
         self,
         client: AsyncClient,
-        mock_project_repo: AsyncMock,
-        sample_project: Project,
+        mock_project_repo: FakeProjectRepo,
+        method: str,
+        path: str,
+        body: dict[str, Any] | None,
+        repo_state: dict[str, Any],
+        expected_status: int,
+        expected_fields: dict[str, Any] | None,
+        expected_create_calls: list[dict[str, Any]] | None,
     ) -> None:
-        """Test successful project creation."""
-        mock_project_repo.get_by_name.return_value = None
-        mock_project_repo.create.return_value = sample_project
+        """Test each CRUD operation against canned repository state."""
+        for attr, value in repo_state.items():
+            setattr(mock_project_repo, attr, value)
 
-        response = await client.post(
-            "/api/v1/projects",
-            json={"name": "Test Project", "color": "#FF5733"},
-        )
+        kwargs = {"json": body} if body is not None else {}
+        response = await getattr(client, method)(path, **kwargs)
+
+        assert response.status_code == expected_status
+        if expected_fields is not None:
+            data = parse_body(response)
+            for key, value in expected_fields.items():
+                assert data[key] == value
+        if expected_create_calls is not None:
+            assert mock_project_repo.create_calls == expected_create_calls
 
-        assert response.status_code == 201
-        data = response.json()
-        assert data["name"] == "Test Project"
-        assert data["color"] == "#FF5733"
-        mock_project_repo.create.assert_called_once_with(name="Test Project", color="#FF5733")
 
-    @pytest.mark.asyncio
+class TestCreateProject:
+    """Tests for POST /api/v1/projects edge cases."""
+
     async def test_create_project_conflict(
         self,
         client: AsyncClient,
-        mock_project_repo: AsyncMock,
+        mock_project_repo: FakeProjectRepo,
         sample_project: Project,
     ) -> None:
         """Test creating project with existing name returns 409."""
-        mock_project_repo.get_by_name.return_value = sample_project
+        mock_project_repo.by_name = sample_project
 
         response = await client.post(
             "/api/v1/projects",
@@ -95,23 +245,21 @@ class TestCreateProject:
         )
 
         assert response.status_code == 409
-        assert "already exists" in response.json()["detail"]
+        assert "already exists" in parse_body(response)["detail"]
 
-    @pytest.mark.asyncio
     async def test_create_project_without_color(
         self,
         client: AsyncClient,
-        mock_project_repo: AsyncMock,
+        mock_project_repo: FakeProjectRepo,
     ) -> None:
         """Test creating project without color."""
         project = Project(
             id=uuid4(),
             name="No Color Project",
             color=None,
-            created_at=datetime.now(UTC),
+            created_at=_FIXED_DT,
         )
-        mock_project_repo.get_by_name.return_value = None
-        mock_project_repo.create.return_value = project
+        mock_project_repo.created = project
 
         response = await client.post(
             "/api/v1/projects",
@@ -119,10 +267,9 @@ class TestCreateProject:
         )
 
         assert response.status_code == 201
-        data = response.json()
+        data = parse_body(response)
         assert data["color"] is None
 
-    @pytest.mark.asyncio
     async def test_create_project_invalid_color(
         self,
         client: AsyncClient,
@@ -135,7 +282,6 @@ class TestCreateProject:
 
         assert response.status_code == 422  # Validation error
 
-    @pytest.mark.asyncio
     async def test_create_project_empty_name(
         self,
         client: AsyncClient,
@@ -152,132 +298,41 @@ class TestCreateProject:
 class TestListProjects:
     """Tests for GET /api/v1/projects."""
 
-    @pytest.mark.asyncio
     async def test_list_projects_empty(
         self,
         client: AsyncClient,
-        mock_project_repo: AsyncMock,
+        mock_project_repo: FakeProjectRepo,
     ) -> None:
         """Test listing projects when none exist."""
-        mock_project_repo.get_all.return_value = []
+        mock_project_repo.all_projects = []
 
         response = await client.get("/api/v1/projects")
 
         assert response.status_code == 200
-        assert response.json() == []
+        assert parse_body(response) == []
 
-    @pytest.mark.asyncio
     async def test_list_projects_multiple(
         self,
         client: AsyncClient,
-        mock_project_repo: AsyncMock,
+        mock_project_repo: FakeProjectRepo,
     ) -> None:
         """Test listing multiple projects."""
-        projects = [
-            Project(
-                id=uuid4(),
-                name=f"Project {i}",
-                color=None,
-                created_at=datetime.now(UTC),
-            )
-            for i in range(3)
-        ]
-        mock_project_repo.get_all.return_value = projects
+        mock_project_repo.all_projects = _THREE_PROJECTS
 
         response = await client.get("/api/v1/projects")
 
         assert response.status_code == 200
-        data = response.json()
+        data = parse_body(response)
         assert len(data) == 3
 
 
-class TestGetProject:
-    """Tests for GET /api/v1/projects/{project_id}."""
-
-    @pytest.mark.asyncio
-    async def test_get_project_success(
-        self,
-        client: AsyncClient,
-        mock_project_repo: AsyncMock,
-        sample_project: Project,
-    ) -> None:
-        """Test getting existing project."""
-        mock_project_repo.get_by_id.return_value = sample_project
-
-        response = await client.get(f"/api/v1/projects/{sample_project.id}")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["id"] == str(sample_project.id)
-        assert data["name"] == sample_project.name
-
-    @pytest.mark.asyncio
-    async def test_get_project_not_found(
-        self,
-        client: AsyncClient,
-        mock_project_repo: AsyncMock,
-    ) -> None:
-        """Test getting non-existent project."""
-        mock_project_repo.get_by_id.return_value = None
-
-        response = await client.get(f"/api/v1/projects/{uuid4()}")
-
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"]
-
-
 class TestUpdateProject:
-    """Tests for PATCH /api/v1/projects/{project_id}."""
+    """Tests for PATCH /api/v1/projects/{project_id} edge cases."""
 
-    @pytest.mark.asyncio
-    async def test_update_project_success(
-        self,
-        client: AsyncClient,
-        mock_project_repo: AsyncMock,
-        sample_project: Project,
-    ) -> None:
-        """Test updating project."""
-        mock_project_repo.get_by_name.return_value = None
-        updated_project = Project(
-            id=sample_project.id,
-            name="Updated Name",
-            color="#00FF00",
-            created_at=sample_project.created_at,
-        )
-        mock_project_repo.update.return_value = updated_project
-
-        response = await client.patch(
-            f"/api/v1/projects/{sample_project.id}",
-            json={"name": "Updated Name", "color": "#00FF00"},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["name"] == "Updated Name"
-        assert data["color"] == "#00FF00"
-
-    @pytest.mark.asyncio
-    async def test_update_project_not_found(
-        self,
-        client: AsyncClient,
-        mock_project_repo: AsyncMock,
-    ) -> None:
-        """Test updating non-existent project."""
-        mock_project_repo.get_by_name.return_value = None
-        mock_project_repo.update.return_value = None
-
-        response = await client.patch(
-            f"/api/v1/projects/{uuid4()}",
-            json={"name": "New Name"},
-        )
-
-        assert response.status_code == 404
-
-    @pytest.mark.asyncio
     async def test_update_project_name_conflict(
         self,
         client: AsyncClient,
-        mock_project_repo: AsyncMock,
+        mock_project_repo: FakeProjectRepo,
         sample_project: Project,
     ) -> None:
         """Test updating project with conflicting name."""
@@ -285,9 +340,9 @@ class TestUpdateProject:
             id=uuid4(),  # Different ID
             name="Taken Name",
             color=None,
-            created_at=datetime.now(UTC),
+            created_at=_FIXED_DT,
         )
-        mock_project_repo.get_by_name.return_value = conflicting_project
+        mock_project_repo.by_name = conflicting_project
 
         response = await client.patch(
             f"/api/v1/projects/{sample_project.id}",
@@ -295,51 +350,3 @@ class TestUpdateProject:
         )
 
         assert response.status_code == 409
-
-    @pytest.mark.asyncio
-    async def test_update_project_same_name_same_project(
-        self,
-        client: AsyncClient,
-        mock_project_repo: AsyncMock,
-        sample_project: Project,
-    ) -> None:
-        """Test updating project with its own current name (no conflict)."""
-        mock_project_repo.get_by_name.return_value = sample_project
-        mock_project_repo.update.return_value = sample_project
-
-        response = await client.patch(
-            f"/api/v1/projects/{sample_project.id}",
-            json={"name": sample_project.name},
-        )
-
-        assert response.status_code == 200
-
-
-class TestDeleteProject:
-    """Tests for DELETE /api/v1/projects/{project_id}."""
-
-    @pytest.mark.asyncio
-    async def test_delete_project_success(
-        self,
-        client: AsyncClient,
-        mock_project_repo: AsyncMock,
-    ) -> None:
-        """Test deleting existing project."""
-        mock_project_repo.delete.return_value = True
-
-        response = await client.delete(f"/api/v1/projects/{uuid4()}")
-
-        assert response.status_code == 204
-
-    @pytest.mark.asyncio
-    async def test_delete_project_not_found(
-        self,
-        client: AsyncClient,
-        mock_project_repo: AsyncMock,
-    ) -> None:
-        """Test deleting non-existent project."""
-        mock_project_repo.delete.return_value = False
-
-        response = await client.delete(f"/api/v1/projects/{uuid4()}")
-
-        assert response.status_code == 404
@@ -1,26 +1,73 @@
 """Tests for Schedules API routes."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock
-from uuid import uuid4
+from typing import Any
+from uuid import UUID, uuid4
 
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
+from axela.api.deps import get_schedule_repository
 from axela.api.routes.schedules import router
 from axela.domain.enums import DigestType
 from axela.domain.models import Schedule
+from tests.conftest import parse_body
 
+_FIXED_DT = datetime(2025, 1, 1, tzinfo=UTC)
 
-@pytest.fixture
-def mock_schedule_repo() -> AsyncMock:
-    """Return mock schedule repository."""
-    return AsyncMock()
+# Prototype rows for list-shape tests; built once at import since the
+# tests only assert on response length.
+_THREE_SCHEDULES = [
+    Schedule(
+        id=uuid4(),
+        name=f"Schedule {i}",
+        digest_type=DigestType.MORNING,
+        cron_expression=f"0 {8 + i} * * *",
+        timezone="Europe/Lisbon",
+        is_active=True,
+        project_ids=[],
+        created_at=_FIXED_DT,
+    )
+    for i in range(3)
+]
 
 
-@pytest.fixture
+# The not-found/delete tests never dereference this id, so one is enough.
+_DUMMY_PATH = f"/api/v1/schedules/{uuid4()}"
+
+
+class FakeScheduleRepo:
+    """Hand-rolled ScheduleRepository stand-in with canned return values."""
+
+    def __init__(self) -> None:
+        self.created: Schedule | None = None
+        self.active: list[Schedule] = []
+        self.by_id: Schedule | None = None
+        self.updated: Schedule | None = None
+        self.deleted = False
+
+    async def create(self, **kwargs: Any) -> Schedule | None:
+        return self.created
+
+    async def get_active(self) -> list[Schedule]:
+        return self.active
+
+    async def get_by_id(self, schedule_id: UUID) -> Schedule | None:
+        return self.by_id
+
+    async def update(self, schedule_id: UUID, **kwargs: Any) -> Schedule | None:
+        return self.updated
+
+    async def delete(self, schedule_id: UUID) -> bool:
+        return self.deleted
+
+
+# The domain models are frozen dataclasses, so one instance can be
+# shared by every test in the module.
+@pytest.fixture(scope="module")
 def sample_schedule() -> Schedule:
     """Return sample schedule."""
     return Schedule(
@@ -35,23 +82,25 @@ def sample_schedule() -> Schedule:
     )
 
 
-@pytest.fixture
-def app(mock_schedule_repo: AsyncMock) -> FastAPI:
-    """Create test FastAPI app with mocked dependencies."""
+@pytest.fixture(scope="module")
+def app() -> FastAPI:
+    """Create test FastAPI app shared across the module."""
     app = FastAPI()
     app.include_router(router, prefix="/api/v1")
-
-    # Override the dependency
-    from axela.api.deps import get_schedule_repository
-
-    app.dependency_overrides[get_schedule_repository] = lambda: mock_schedule_repo
-
     return app
 
 
 @pytest.fixture
+def mock_schedule_repo(app: FastAPI) -> FakeScheduleRepo:
+    """Return fake schedule repository wired into the shared app."""
+    repo = FakeScheduleRepo()
+    app.dependency_overrides[get_schedule_repository] = lambda: repo
+    return repo
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def client(app: FastAPI) -> AsyncGenerator[AsyncClient]:
-    """Create async test client."""
+    """Create async test client shared across the module."""
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
@@ -59,18 +108,24 @@ async def client(app: FastAPI) -> AsyncGenerator[AsyncClient]:
         yield client
 
 
+@pytest.fixture(autouse=True)
+def _clear_overrides(app: FastAPI) -> Generator[None]:
+    """Drop dependency overrides so mocks never leak between tests."""
+    yield
+    app.dependency_overrides.clear()
+
+
 class TestCreateSchedule:
     """Tests for POST /api/v1/schedules."""
 
-    @pytest.mark.asyncio
     async def test_create_schedule_success(
         self,
         client: AsyncClient,
-        mock_schedule_repo: AsyncMock,
+        mock_schedule_repo: FakeScheduleRepo,
         sample_schedule: Schedule,
     ) -> None:
         """Test successful schedule creation."""
-        mock_schedule_repo.create.return_value = sample_schedule
+        mock_schedule_repo.created = sample_schedule
 
         response = await client.post(
             "/api/v1/schedules",
@@ -83,16 +138,15 @@ class TestCreateSchedule:
         )
 
         assert response.status_code == 201
-        data = response.json()
+        data = parse_body(response)
         assert data["name"] == "Morning Digest"
         assert data["digest_type"] == "morning"
         assert data["cron_expression"] == "0 8 * * *"
 
-    @pytest.mark.asyncio
     async def test_create_schedule_with_projects(
         self,
         client: AsyncClient,
-        mock_schedule_repo: AsyncMock,
+        mock_schedule_repo: FakeScheduleRepo,
     ) -> None:
         """Test creating schedule with project IDs."""
         project_ids = [uuid4(), uuid4()]
@@ -106,7 +160,7 @@ class TestCreateSchedule:
             project_ids=project_ids,
             created_at=datetime.now(UTC),
         )
-        mock_schedule_repo.create.return_value = schedule
+        mock_schedule_repo.created = schedule
 
         response = await client.post(
             "/api/v1/schedules",
@@ -119,10 +173,9 @@ class TestCreateSchedule:
         )
 
         assert response.status_code == 201
-        data = response.json()
+        data = parse_body(response)
         assert len(data["project_ids"]) == 2
 
-    @pytest.mark.asyncio
     async def test_create_schedule_invalid_digest_type(
         self,
         client: AsyncClient,
@@ -139,7 +192,6 @@ class TestCreateSchedule:
 
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_create_schedule_empty_name(
         self,
         client: AsyncClient,
@@ -160,92 +212,74 @@ class TestCreateSchedule:
 class TestListSchedules:
     """Tests for GET /api/v1/schedules."""
 
-    @pytest.mark.asyncio
     async def test_list_schedules_empty(
         self,
         client: AsyncClient,
-        mock_schedule_repo: AsyncMock,
+        mock_schedule_repo: FakeScheduleRepo,
     ) -> None:
         """Test listing schedules when none exist."""
-        mock_schedule_repo.get_active.return_value = []
+        mock_schedule_repo.active = []
 
         response = await client.get("/api/v1/schedules")
 
         assert response.status_code == 200
-        assert response.json() == []
+        assert parse_body(response) == []
 
-    @pytest.mark.asyncio
     async def test_list_schedules_multiple(
         self,
         client: AsyncClient,
-        mock_schedule_repo: AsyncMock,
+        mock_schedule_repo: FakeScheduleRepo,
     ) -> None:
         """Test listing multiple schedules."""
-        schedules = [
-            Schedule(
-                id=uuid4(),
-                name=f"Schedule {i}",
-                digest_type=DigestType.MORNING,
-                cron_expression=f"0 {8 + i} * * *",
-                timezone="Europe/Lisbon",
-                is_active=True,
-                project_ids=[],
-                created_at=datetime.now(UTC),
-            )
-            for i in range(3)
-        ]
-        mock_schedule_repo.get_active.return_value = schedules
+        mock_schedule_repo.active = _THREE_SCHEDULES
 
         response = await client.get("/api/v1/schedules")
 
         assert response.status_code == 200
-        data = response.json()
+        data = parse_body(response)
         assert len(data) == 3
 
 
 class TestGetSchedule:
     """Tests for GET /api/v1/schedules/{schedule_id}."""
 
-    @pytest.mark.asyncio
     async def test_get_schedule_success(
         self,
         client: AsyncClient,
-        mock_schedule_repo: AsyncMock,
+        mock_schedule_repo: FakeScheduleRepo,
         sample_schedule: Schedule,
     ) -> None:
         """Test getting existing schedule."""
-        mock_schedule_repo.get_by_id.return_value = sample_schedule
+        mock_schedule_repo.by_id = sample_schedule
 
         response = await client.get(f"/api/v1/schedules/{sample_schedule.id}")
 
         assert response.status_code == 200
-        data = response.json()
+        data = parse_body(response)
         assert data["id"] == str(sample_schedule.id)
         assert data["name"] == sample_schedule.name
 
-    @pytest.mark.asyncio
     async def test_get_schedule_not_found(
         self,
         client: AsyncClient,
-        mock_schedule_repo: AsyncMock,
+        mock_schedule_repo: FakeScheduleRepo,
     ) -> None:
         """Test getting non-existent schedule."""
-        mock_schedule_repo.get_by_id.return_value = None
+        mock_schedule_repo.by_id = None
 
-        response = await client.get(f"/api/v1/schedules/{uuid4()}")
+        response = await client.get(_DUMMY_PATH)
 
         assert response.status_code == 404
-        assert "not found" in response.json()["detail"]
+        assert "not found" in parse_body(response)["detail"]
 
 
 class TestUpdateSchedule:
     """Tests for PATCH /api/v1/schedules/{schedule_id}."""
 
-    @pytest.mark.asyncio
     async def test_update_schedule_success(
         self,
         client: AsyncClient,
-        mock_schedule_repo: AsyncMock,
+        mock_schedule_repo: FakeScheduleRepo,
         sample_schedule: Schedule,
     ) -> None:
         """Test updating schedule."""
@@ -259,7 +293,7 @@ class TestUpdateSchedule:
             project_ids=sample_schedule.project_ids,
             created_at=sample_schedule.created_at,
         )
-        mock_schedule_repo.update.return_value = updated_schedule
+        mock_schedule_repo.updated = updated_schedule
 
         response = await client.patch(
             f"/api/v1/schedules/{sample_schedule.id}",
@@ -272,32 +306,27 @@ class TestUpdateSchedule:
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = parse_body(response)
         assert data["name"] == "Updated Morning Digest"
         assert data["cron_expression"] == "0 9 * * *"
         assert data["is_active"] is False
 
-    @pytest.mark.asyncio
     async def test_update_schedule_not_found(
         self,
         client: AsyncClient,
-        mock_schedule_repo: AsyncMock,
+        mock_schedule_repo: FakeScheduleRepo,
     ) -> None:
         """Test updating non-existent schedule."""
-        mock_schedule_repo.update.return_value = None
+        mock_schedule_repo.updated = None
 
-        response = await client.patch(
-            f"/api/v1/schedules/{uuid4()}",
-            json={"name": "New Name"},
-        )
+        response = await client.patch(_DUMMY_PATH, json={"name": "New Name"})
 
         assert response.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_update_schedule_project_ids(
         self,
         client: AsyncClient,
-        mock_schedule_repo: AsyncMock,
+        mock_schedule_repo: FakeScheduleRepo,
         sample_schedule: Schedule,
     ) -> None:
         """Test updating schedule project IDs."""
@@ -312,7 +341,7 @@ class TestUpdateSchedule:
             project_ids=new_project_ids,
             created_at=sample_schedule.created_at,
         )
-        mock_schedule_repo.update.return_value = updated_schedule
+        mock_schedule_repo.updated = updated_schedule
 
         response = await client.patch(
             f"/api/v1/schedules/{sample_schedule.id}",
@@ -320,35 +349,33 @@ class TestUpdateSchedule:
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = parse_body(response)
         assert len(data["project_ids"]) == 2
 
 
 class TestDeleteSchedule:
     """Tests for DELETE /api/v1/schedules/{schedule_id}."""
 
-    @pytest.mark.asyncio
     async def test_delete_schedule_success(
         self,
         client: AsyncClient,
-        mock_schedule_repo: AsyncMock,
+        mock_schedule_repo: FakeScheduleRepo,
     ) -> None:
         """Test deleting existing schedule."""
-        mock_schedule_repo.delete.return_value = True
+        mock_schedule_repo.deleted = True
 
-        response = await client.delete(f"/api/v1/schedules/{uuid4()}")
+        response = await client.delete(_DUMMY_PATH)
 
         assert response.status_code == 204
 
-    @pytest.mark.asyncio
     async def test_delete_schedule_not_found(
         self,
         client: AsyncClient,
-        mock_schedule_repo: AsyncMock,
+        mock_schedule_repo: FakeScheduleRepo,
     ) -> None:
         """Test deleting non-existent schedule."""
-        mock_schedule_repo.delete.return_value = False
+        mock_schedule_repo.deleted = False
 
-        response = await client.delete(f"/api/v1/schedules/{uuid4()}")
+        response = await client.delete(_DUMMY_PATH)
 
         assert response.status_code == 404
@@ -1,50 +1,109 @@
 """Tests for Settings API routes."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock
 
+import orjson
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
+from axela.api.deps import get_settings_repository
 from axela.api.routes.settings import router
 from axela.domain.models import Setting
 
 
-@pytest.fixture
-def mock_settings_repo() -> AsyncMock:
-    """Return mock settings repository."""
-    return AsyncMock()
-
-
-@pytest.fixture
+class FakeSettingsRepo:
+    """Hand-rolled SettingsRepository stand-in with canned returns and recorded calls."""
+
+    def __init__(self) -> None:
+        self.all_settings: list[Setting] = []
+        self.setting: Setting | None = None
+        self.set_result: Setting | None = None
+        self.deleted = False
+        self.get_calls: list[str] = []
+        self.set_calls: list[tuple[str, object]] = []
+        self.delete_calls: list[str] = []
+
+    async def get_all(self) -> list[Setting]:
+        return self.all_settings
+
+    async def get(self, key: str) -> Setting | None:
+        self.get_calls.append(key)
+        return self.setting
+
+    async def set(self, key: str, value: object) -> Setting | None:
+        self.set_calls.append((key, value))
+        return self.set_result
+
+    async def delete(self, key: str) -> bool:
+        self.delete_calls.append(key)
+        return self.deleted
+
+
+_FIXED_DT = datetime(2025, 1, 1, tzinfo=UTC)
+
+_COMPLEX_VALUE = {
+    "nested": {
+        "key": "value",
+        "list": [1, 2, 3],
+    },
+    "enabled": True,
+}
+# Serialized once at import; httpx would otherwise re-encode the same
+# dict on every run of the complex-value test.
+_COMPLEX_BODY = orjson.dumps({"value": _COMPLEX_VALUE})
+_JSON_HEADERS = {"content-type": "application/json"}
+
+_THREE_SETTINGS = [
+    Setting(key="telegram_chat_id", value=123456789, updated_at=_FIXED_DT),
+    Setting(key="digest_language", value="ru", updated_at=_FIXED_DT),
+    Setting(key="theme", value="dark", updated_at=_FIXED_DT),
+]
+_TYPED_SETTINGS = [
+    Setting(key="int_setting", value=42, updated_at=_FIXED_DT),
+    Setting(key="str_setting", value="text", updated_at=_FIXED_DT),
+    Setting(key="bool_setting", value=True, updated_at=_FIXED_DT),
+    Setting(key="list_setting", value=[1, 2, 3], updated_at=_FIXED_DT),
+    Setting(key="dict_setting", value={"nested": "value"}, updated_at=_FIXED_DT),
+]
+
+
+# The domain models are frozen dataclasses, so one instance can be
+# shared by every test in the module.
+_SAMPLE_SETTING = Setting(
+    key="telegram_chat_id",
+    value=123456789,
+    updated_at=_FIXED_DT,
+)
+
+
+@pytest.fixture(scope="module")
 def sample_setting() -> Setting:
     """Return sample setting."""
-    return Setting(
-        key="telegram_chat_id",
-        value=123456789,
-        updated_at=datetime.now(UTC),
-    )
+    return _SAMPLE_SETTING
 
 
-@pytest.fixture
-def app(mock_settings_repo: AsyncMock) -> FastAPI:
-    """Create test FastAPI app with mocked dependencies."""
+@pytest.fixture(scope="module")
+def app() -> FastAPI:
+    """Create test FastAPI app shared across the module."""
     app = FastAPI()
     app.include_router(router, prefix="/api/v1")
-
-    # Override the dependency
-    from axela.api.deps import get_settings_repository
-
-    app.dependency_overrides[get_settings_repository] = lambda: mock_settings_repo
-
     return app
 
 
 @pytest.fixture
+def mock_settings_repo(app: FastAPI) -> FakeSettingsRepo:
+    """Return fake settings repository wired into the shared app."""
+    repo = FakeSettingsRepo()
+    app.dependency_overrides[get_settings_repository] = lambda: repo
+    return repo
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def client(app: FastAPI) -> AsyncGenerator[AsyncClient]:
-    """Create async test client."""
+    """Create async test client shared across the module."""
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
@@ -52,77 +111,50 @@ async def client(app: FastAPI) -> AsyncGenerator[AsyncClient]:
         yield client
 
 
-class TestListSettings:
-    """Tests for GET /api/v1/settings."""
+@pytest.fixture(autouse=True)
+def _clear_overrides(app: FastAPI) -> Generator[None]:
+    """Drop dependency overrides so mocks never leak between tests."""
+    yield
+    app.dependency_overrides.clear()
 
-    @pytest.mark.asyncio
-    async def test_list_settings_empty(
-        self,
-        client: AsyncClient,
-        mock_settings_repo: AsyncMock,
-    ) -> None:
-        """Test listing settings when none exist."""
-        mock_settings_repo.get_all.return_value = []
 
-        response = await client.get("/api/v1/settings")
-
-        assert response.status_code == 200
-        assert response.json() == []
-
-    @pytest.mark.asyncio
-    async def test_list_settings_multiple(
-        self,
-        client: AsyncClient,
-        mock_settings_repo: AsyncMock,
-    ) -> None:
-        """Test listing multiple settings."""
-        settings = [
-            Setting(key="telegram_chat_id", value=123456789, updated_at=datetime.now(UTC)),
-            Setting(key="digest_language", value="ru", updated_at=datetime.now(UTC)),
-            Setting(key="theme", value="dark", updated_at=datetime.now(UTC)),
-        ]
-        mock_settings_repo.get_all.return_value = settings
-
-        response = await client.get("/api/v1/settings")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 3
-        keys = [s["key"] for s in data]
-        assert "telegram_chat_id" in keys
-        assert "digest_language" in keys
+class TestListSettings:
+    """Tests for GET /api/v1/settings."""
 
-    @pytest.mark.asyncio
-    async def test_list_settings_with_various_types(
+    @pytest.mark.parametrize(
+        ("payload", "expected_values"),
+        [
+            pytest.param([], {}, id="empty"),
+            pytest.param(
+                _THREE_SETTINGS,
+                {"telegram_chat_id": 123456789, "digest_language": "ru"},
+                id="multiple",
+            ),
+            pytest.param(
+                _TYPED_SETTINGS,
+                {"int_setting": 42, "list_setting": [1, 2, 3], "dict_setting": {"nested": "value"}},
+                id="various-types",
+            ),
+        ],
+    )
+    async def test_list_settings(
         self,
         client: AsyncClient,
-        mock_settings_repo: AsyncMock,
+        mock_settings_repo: FakeSettingsRepo,
+        payload: list[Setting],
+        expected_values: dict[str, object],
     ) -> None:
-        """Test listing settings with various value types."""
-        settings = [
-            Setting(key="int_setting", value=42, updated_at=datetime.now(UTC)),
-            Setting(key="str_setting", value="text", updated_at=datetime.now(UTC)),
-            Setting(key="bool_setting", value=True, updated_at=datetime.now(UTC)),
-            Setting(key="list_setting", value=[1, 2, 3], updated_at=datetime.now(UTC)),
-            Setting(key="dict_setting", value={"nested": "value"}, updated_at=datetime.now(UTC)),
-        ]
-        mock_settings_repo.get_all.return_value = settings
+        """Test listing settings of varying shapes; values survive round-trip."""
+        mock_settings_repo.all_settings = payload
 
         response = await client.get("/api/v1/settings")
 
         assert response.status_code == 200
         data = response.json()
-        assert len(data) == 5
-
-        # Verify types are preserved
-        int_setting = next(s for s in data if s["key"] == "int_setting")
-        assert int_setting["value"] == 42
-
-        list_setting = next(s for s in data if s["key"] == "list_setting")
-        assert list_setting["value"] == [1, 2, 3]
-
-        dict_setting = next(s for s in data if s["key"] == "dict_setting")
-        assert dict_setting["value"] == {"nested": "value"}
+        assert len(data) == len(payload)
+        by_key = {setting["key"]: setting["value"] for setting in data}
+        for key, value in expected_values.items():
+            assert by_key[key] == value
 
 
 class TestGetSetting:
@@ -132,11 +164,11 @@ class TestGetSetting:
     async def test_get_setting_success(
         self,
         client: AsyncClient,
-        mock_settings_repo: AsyncMock,
+        mock_settings_repo: FakeSettingsRepo,
         sample_setting: Setting,
     ) -> None:
         """Test getting existing setting."""
-        mock_settings_repo.get.return_value = sample_setting
+        mock_settings_repo.setting = sample_setting
 
         response = await client.get("/api/v1/settings/telegram_chat_id")
 
@@ -144,16 +176,16 @@ class TestGetSetting:
         data = response.json()
         assert data["key"] == "telegram_chat_id"
         assert data["value"] == 123456789
-        mock_settings_repo.get.assert_called_once_with("telegram_chat_id")
+        assert mock_settings_repo.get_calls == ["telegram_chat_id"]
 
     @pytest.mark.asyncio
     async def test_get_setting_not_found(
         self,
         client: AsyncClient,
-        mock_settings_repo: AsyncMock,
+        mock_settings_repo: FakeSettingsRepo,
     ) -> None:
         """Test getting non-existent setting."""
-        mock_settings_repo.get.return_value = None
+        mock_settings_repo.setting = None
 
         response = await client.get("/api/v1/settings/nonexistent")
 
@@ -164,15 +196,15 @@ class TestGetSetting:
     async def test_get_setting_with_special_characters(
         self,
         client: AsyncClient,
-        mock_settings_repo: AsyncMock,
+        mock_settings_repo: FakeSettingsRepo,
     ) -> None:
         """Test getting setting with underscore in key."""
         setting = Setting(
             key="some_complex_key_name",
             value="value",
-            updated_at=datetime.now(UTC),
+            updated_at=_FIXED_DT,
         )
-        mock_settings_repo.get.return_value = setting
+        mock_settings_repo.setting = setting
 
         response = await client.get("/api/v1/settings/some_complex_key_name")
 
@@ -182,107 +214,56 @@ class TestGetSetting:
 class TestUpdateSetting:
     """Tests for PUT /api/v1/settings/{key}."""
 
-    @pytest.mark.asyncio
-    async def test_update_setting_success(
+    @pytest.mark.parametrize(
+        ("key", "value", "expect_set_call"),
+        [
+            pytest.param("telegram_chat_id", 987654321, True, id="update-existing"),
+            pytest.param("new_setting", "new_value", False, id="creates-new"),
+            pytest.param("nullable_setting", None, False, id="null-value"),
+        ],
+    )
+    async def test_update_setting(
         self,
         client: AsyncClient,
-        mock_settings_repo: AsyncMock,
+        mock_settings_repo: FakeSettingsRepo,
+        key: str,
+        value: object,
+        expect_set_call: bool,
     ) -> None:
-        """Test updating setting."""
-        updated_setting = Setting(
-            key="telegram_chat_id",
-            value=987654321,
-            updated_at=datetime.now(UTC),
-        )
-        mock_settings_repo.set.return_value = updated_setting
+        """Test PUT round-trips values of different shapes."""
+        mock_settings_repo.set_result = Setting(key=key, value=value, updated_at=_FIXED_DT)
 
-        response = await client.put(
-            "/api/v1/settings/telegram_chat_id",
-            json={"value": 987654321},
-        )
+        response = await client.put(f"/api/v1/settings/{key}", json={"value": value})
 
         assert response.status_code == 200
         data = response.json()
-        assert data["key"] == "telegram_chat_id"
-        assert data["value"] == 987654321
-        mock_settings_repo.set.assert_called_once_with("telegram_chat_id", 987654321)
-
-    @pytest.mark.asyncio
-    async def test_update_setting_creates_new(
-        self,
-        client: AsyncClient,
-        mock_settings_repo: AsyncMock,
-    ) -> None:
-        """Test creating new setting via PUT."""
-        new_setting = Setting(
-            key="new_setting",
-            value="new_value",
-            updated_at=datetime.now(UTC),
-        )
-        mock_settings_repo.set.return_value = new_setting
-
-        response = await client.put(
-            "/api/v1/settings/new_setting",
-            json={"value": "new_value"},
-        )
+        assert data["key"] == key
+        assert data["value"] == value
+        if expect_set_call:
+            assert mock_settings_repo.set_calls == [(key, value)]
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["key"] == "new_setting"
-        assert data["value"] == "new_value"
-
-    @pytest.mark.asyncio
     async def test_update_setting_with_complex_value(
         self,
         client: AsyncClient,
-        mock_settings_repo: AsyncMock,
+        mock_settings_repo: FakeSettingsRepo,
     ) -> None:
         """Test updating setting with complex JSON value."""
-        complex_value = {
-            "nested": {
-                "key": "value",
-                "list": [1, 2, 3],
-            },
-            "enabled": True,
-        }
         new_setting = Setting(
             key="complex_setting",
-            value=complex_value,
-            updated_at=datetime.now(UTC),
+            value=_COMPLEX_VALUE,
+            updated_at=_FIXED_DT,
         )
-        mock_settings_repo.set.return_value = new_setting
+        mock_settings_repo.set_result = new_setting
 
         response = await client.put(
             "/api/v1/settings/complex_setting",
-            json={"value": complex_value},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["value"] == complex_value
-
-    @pytest.mark.asyncio
-    async def test_update_setting_with_null_value(
-        self,
-        client: AsyncClient,
-        mock_settings_repo: AsyncMock,
-    ) -> None:
-        """Test updating setting with null value."""
-        new_setting = Setting(
-            key="nullable_setting",
-            value=None,
-            updated_at=datetime.now(UTC),
-        )
-        mock_settings_repo.set.return_value = new_setting
-
-        response = await client.put(
-            "/api/v1/settings/nullable_setting",
-            json={"value": None},
+            content=_COMPLEX_BODY,
+            headers=_JSON_HEADERS,
         )
 
         assert response.status_code == 200
         data = response.json()
-        assert data["value"] is None
+        assert data["value"] == _COMPLEX_VALUE
 
 
 class TestDeleteSetting:
@@ -292,24 +273,24 @@ class TestDeleteSetting:
     async def test_delete_setting_success(
         self,
         client: AsyncClient,
-        mock_settings_repo: AsyncMock,
+        mock_settings_repo: FakeSettingsRepo,
     ) -> None:
         """Test deleting existing setting."""
-        mock_settings_repo.delete.return_value = True
+        mock_settings_repo.deleted = True
 
         response = await client.delete("/api/v1/settings/telegram_chat_id")
 
         assert response.status_code == 204
-        mock_settings_repo.delete.assert_called_once_with("telegram_chat_id")
+        assert mock_settings_repo.delete_calls == ["telegram_chat_id"]
 
     @pytest.mark.asyncio
     async def test_delete_setting_not_found(
         self,
         client: AsyncClient,
-        mock_settings_repo: AsyncMock,
+        mock_settings_repo: FakeSettingsRepo,
     ) -> None:
         """Test deleting non-existent setting."""
-        mock_settings_repo.delete.return_value = False
+        mock_settings_repo.deleted = False
 
         response = await client.delete("/api/v1/settings/nonexistent")
 
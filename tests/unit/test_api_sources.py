@@ -1,76 +1,110 @@
 """Tests for Sources API routes."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import orjson
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
+from axela.api.deps import get_project_repository, get_source_repository
 from axela.api.routes.sources import router
 from axela.domain.enums import SourceType
 from axela.domain.models import Project, Source
 
-
-@pytest.fixture
-def mock_source_repo() -> AsyncMock:
-    """Return mock source repository."""
-    return AsyncMock()
-
-
-@pytest.fixture
-def mock_project_repo() -> AsyncMock:
-    """Return mock project repository."""
-    return AsyncMock()
-
-
-@pytest.fixture
+_FIXED_DT = datetime(2025, 1, 1, tzinfo=UTC)
+
+# The domain models are frozen dataclasses, so one instance can be
+# shared by every test in the module.
+_SAMPLE_PROJECT = Project(
+    id=uuid4(),
+    name="Test Project",
+    color="#FF5733",
+    created_at=_FIXED_DT,
+)
+_SAMPLE_SOURCE = Source(
+    id=uuid4(),
+    project_id=_SAMPLE_PROJECT.id,
+    source_type=SourceType.JIRA,
+    name="Test Jira",
+    credentials={"api_token": "secret", "email": "test@test.com"},
+    config={"project_key": "TEST"},
+    is_active=True,
+    last_synced_at=None,
+    created_at=_FIXED_DT,
+)
+
+# Serialized once at import; httpx would otherwise re-encode the same
+# dict on every run of the create-success test.
+_CREATE_SOURCE_BODY = orjson.dumps(
+    {
+        "project_id": str(_SAMPLE_PROJECT.id),
+        "source_type": "jira",
+        "name": "Test Jira",
+        "credentials": {"api_token": "secret", "email": "test@test.com"},
+        "config": {"project_key": "TEST"},
+    }
+)
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Tests that target a nonexistent row never dereference the id, so one
+# module-level value replaces the per-test uuid4 calls.
+_MISSING_ID = uuid4()
+_MISSING_SOURCE_PATH = f"/api/v1/sources/{_MISSING_ID}"
+
+
+@pytest.fixture(scope="module")
 def sample_project() -> Project:
     """Return sample project."""
-    return Project(
-        id=uuid4(),
-        name="Test Project",
-        color="#FF5733",
-        created_at=datetime.now(UTC),
-    )
+    return _SAMPLE_PROJECT
 
 
-@pytest.fixture
-def sample_source(sample_project: Project) -> Source:
+@pytest.fixture(scope="module")
+def sample_source() -> Source:
     """Return sample source."""
-    return Source(
-        id=uuid4(),
-        project_id=sample_project.id,
-        source_type=SourceType.JIRA,
-        name="Test Jira",
-        credentials={"api_token": "secret", "email": "test@test.com"},
-        config={"project_key": "TEST"},
-        is_active=True,
-        last_synced_at=None,
-        created_at=datetime.now(UTC),
-    )
+    return _SAMPLE_SOURCE
 
 
-@pytest.fixture
-def app(mock_source_repo: AsyncMock, mock_project_repo: AsyncMock) -> FastAPI:
-    """Create test FastAPI app with mocked dependencies."""
+@pytest.fixture(scope="module")
+def app() -> FastAPI:
+    """Create test FastAPI app shared across the module."""
     app = FastAPI()
     app.include_router(router, prefix="/api/v1")
+    return app
 
-    # Override the dependencies
-    from axela.api.deps import get_project_repository, get_source_repository
 
-    app.dependency_overrides[get_source_repository] = lambda: mock_source_repo
-    app.dependency_overrides[get_project_repository] = lambda: mock_project_repo
+# Built once: AsyncMock construction is slow enough to matter across a
+# whole module. reset_mock in the fixtures restores per-test isolation;
+# copying a prototype would not, since copies share child mocks.
+_SOURCE_REPO_PROTO = AsyncMock()
+_PROJECT_REPO_PROTO = AsyncMock()
 
-    return app
+
+@pytest.fixture
+def mock_source_repo(app: FastAPI) -> AsyncMock:
+    """Return the shared mock source repository, reset and wired in."""
+    repo = _SOURCE_REPO_PROTO
+    repo.reset_mock(return_value=True, side_effect=True)
+    app.dependency_overrides[get_source_repository] = lambda: repo
+    return repo
 
 
 @pytest.fixture
+def mock_project_repo(app: FastAPI) -> AsyncMock:
+    """Return the shared mock project repository, reset and wired in."""
+    repo = _PROJECT_REPO_PROTO
+    repo.reset_mock(return_value=True, side_effect=True)
+    app.dependency_overrides[get_project_repository] = lambda: repo
+    return repo
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def client(app: FastAPI) -> AsyncGenerator[AsyncClient]:
-    """Create async test client."""
+    """Create async test client shared across the module."""
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
@@ -78,6 +112,31 @@ async def client(app: FastAPI) -> AsyncGenerator[AsyncClient]:
         yield client
 
 
+@pytest.fixture(autouse=True)
+def _clear_overrides(app: FastAPI) -> Generator[None]:
+    """Drop dependency overrides so mocks never leak between tests."""
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _registry_patch() -> Generator[MagicMock]:
+    """Patch CollectorRegistry once for the whole module.
+
+    Installing and removing the patch per test re-walks the target
+    module each time; one module-scoped install is enough.
+    """
+    with patch("axela.api.routes.sources.CollectorRegistry") as registry:
+        yield registry
+
+
+@pytest.fixture
+def mock_registry(_registry_patch: MagicMock) -> MagicMock:
+    """Return the patched registry, reset for this test."""
+    _registry_patch.reset_mock(return_value=True, side_effect=True)
+    return _registry_patch
+
+
 class TestCreateSource:
     """Tests for POST /api/v1/sources."""
 
@@ -89,24 +148,18 @@ class TestCreateSource:
         mock_project_repo: AsyncMock,
         sample_project: Project,
         sample_source: Source,
+        mock_registry: MagicMock,
     ) -> None:
         """Test successful source creation."""
         mock_project_repo.get_by_id.return_value = sample_project
         mock_source_repo.create.return_value = sample_source
+        mock_registry.get.return_value = MagicMock()  # Collector exists
 
-        with patch("axela.api.routes.sources.CollectorRegistry") as mock_registry:
-            mock_registry.get.return_value = MagicMock()  # Collector exists
-
-            response = await client.post(
-                "/api/v1/sources",
-                json={
-                    "project_id": str(sample_project.id),
-                    "source_type": "jira",
-                    "name": "Test Jira",
-                    "credentials": {"api_token": "secret", "email": "test@test.com"},
-                    "config": {"project_key": "TEST"},
-                },
-            )
+        response = await client.post(
+            "/api/v1/sources",
+            content=_CREATE_SOURCE_BODY,
+            headers=_JSON_HEADERS,
+        )
 
         assert response.status_code == 201
         data = response.json()
@@ -125,7 +178,7 @@ class TestCreateSource:
         response = await client.post(
             "/api/v1/sources",
             json={
-                "project_id": str(uuid4()),
+                "project_id": str(_MISSING_ID),
                 "source_type": "jira",
                 "name": "Test Jira",
                 "credentials": {"api_token": "secret"},
@@ -141,22 +194,21 @@ class TestCreateSource:
         client: AsyncClient,
         mock_project_repo: AsyncMock,
         sample_project: Project,
+        mock_registry: MagicMock,
     ) -> None:
         """Test creating source with unavailable collector type."""
         mock_project_repo.get_by_id.return_value = sample_project
+        mock_registry.get.return_value = None  # No collector
 
-        with patch("axela.api.routes.sources.CollectorRegistry") as mock_registry:
-            mock_registry.get.return_value = None  # No collector
-
-            response = await client.post(
-                "/api/v1/sources",
-                json={
-                    "project_id": str(sample_project.id),
-                    "source_type": "jira",
-                    "name": "Test Jira",
-                    "credentials": {"api_token": "secret"},
-                },
-            )
+        response = await client.post(
+            "/api/v1/sources",
+            json={
+                "project_id": str(sample_project.id),
+                "source_type": "jira",
+                "name": "Test Jira",
+                "credentials": {"api_token": "secret"},
+            },
+        )
 
         assert response.status_code == 400
         assert "No collector available" in response.json()["detail"]
@@ -256,7 +308,7 @@ class TestGetSource:
         """Test getting non-existent source."""
         mock_source_repo.get_by_id.return_value = None
 
-        response = await client.get(f"/api/v1/sources/{uuid4()}")
+        response = await client.get(_MISSING_SOURCE_PATH)
 
         assert response.status_code == 404
 
@@ -304,10 +356,7 @@ class TestUpdateSource:
         """Test updating non-existent source."""
         mock_source_repo.update.return_value = None
 
-        response = await client.patch(
-            f"/api/v1/sources/{uuid4()}",
-            json={"name": "New Name"},
-        )
+        response = await client.patch(_MISSING_SOURCE_PATH, json={"name": "New Name"})
 
         assert response.status_code == 404
 
@@ -324,7 +373,7 @@ class TestDeleteSource:
         """Test deleting existing source."""
         mock_source_repo.delete.return_value = True
 
-        response = await client.delete(f"/api/v1/sources/{uuid4()}")
+        response = await client.delete(_MISSING_SOURCE_PATH)
 
         assert response.status_code == 204
 
@@ -337,7 +386,7 @@ class TestDeleteSource:
         """Test deleting non-existent source."""
         mock_source_repo.delete.return_value = False
 
-        response = await client.delete(f"/api/v1/sources/{uuid4()}")
+        response = await client.delete(_MISSING_SOURCE_PATH)
 
         assert response.status_code == 404
 
@@ -354,7 +403,7 @@ class TestSourceCredentials:
         """Test credentials for non-existent source."""
         mock_source_repo.get_by_id.return_value = None
 
-        response = await client.post(f"/api/v1/sources/{uuid4()}/test")
+        response = await client.post(f"{_MISSING_SOURCE_PATH}/test")
 
         assert response.status_code == 404
 
@@ -364,14 +413,13 @@ class TestSourceCredentials:
         client: AsyncClient,
         mock_source_repo: AsyncMock,
         sample_source: Source,
+        mock_registry: MagicMock,
     ) -> None:
         """Test credentials when no collector available."""
         mock_source_repo.get_by_id.return_value = sample_source
+        mock_registry.create.return_value = None
 
-        with patch("axela.api.routes.sources.CollectorRegistry") as mock_registry:
-            mock_registry.create.return_value = None
-
-            response = await client.post(f"/api/v1/sources/{sample_source.id}/test")
+        response = await client.post(f"/api/v1/sources/{sample_source.id}/test")
 
         assert response.status_code == 200
         data = response.json()
@@ -384,16 +432,15 @@ class TestSourceCredentials:
         client: AsyncClient,
         mock_source_repo: AsyncMock,
         sample_source: Source,
+        mock_registry: MagicMock,
     ) -> None:
         """Test valid credentials."""
         mock_source_repo.get_by_id.return_value = sample_source
+        mock_collector = AsyncMock()
+        mock_collector.validate_credentials.return_value = True
+        mock_registry.create.return_value = mock_collector
 
-        with patch("axela.api.routes.sources.CollectorRegistry") as mock_registry:
-            mock_collector = AsyncMock()
-            mock_collector.validate_credentials.return_value = True
-            mock_registry.create.return_value = mock_collector
-
-            response = await client.post(f"/api/v1/sources/{sample_source.id}/test")
+        response = await client.post(f"/api/v1/sources/{sample_source.id}/test")
 
         assert response.status_code == 200
         data = response.json()
@@ -407,16 +454,15 @@ class TestSourceCredentials:
         client: AsyncClient,
         mock_source_repo: AsyncMock,
         sample_source: Source,
+        mock_registry: MagicMock,
     ) -> None:
         """Test invalid credentials."""
         mock_source_repo.get_by_id.return_value = sample_source
+        mock_collector = AsyncMock()
+        mock_collector.validate_credentials.return_value = False
+        mock_registry.create.return_value = mock_collector
 
-        with patch("axela.api.routes.sources.CollectorRegistry") as mock_registry:
-            mock_collector = AsyncMock()
-            mock_collector.validate_credentials.return_value = False
-            mock_registry.create.return_value = mock_collector
-
-            response = await client.post(f"/api/v1/sources/{sample_source.id}/test")
+        response = await client.post(f"/api/v1/sources/{sample_source.id}/test")
 
         assert response.status_code == 200
         data = response.json()
@@ -429,16 +475,15 @@ class TestSourceCredentials:
         client: AsyncClient,
         mock_source_repo: AsyncMock,
         sample_source: Source,
+        mock_registry: MagicMock,
     ) -> None:
         """Test credentials validation raises exception."""
         mock_source_repo.get_by_id.return_value = sample_source
+        mock_collector = AsyncMock()
+        mock_collector.validate_credentials.side_effect = Exception("Connection failed")
+        mock_registry.create.return_value = mock_collector
 
-        with patch("axela.api.routes.sources.CollectorRegistry") as mock_registry:
-            mock_collector = AsyncMock()
-            mock_collector.validate_credentials.side_effect = Exception("Connection failed")
-            mock_registry.create.return_value = mock_collector
-
-            response = await client.post(f"/api/v1/sources/{sample_source.id}/test")
+        response = await client.post(f"/api/v1/sources/{sample_source.id}/test")
 
         assert response.status_code == 200
         data = response.json()
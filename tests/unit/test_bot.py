@@ -1,5 +1,6 @@
 """Tests for Telegram bot."""
 
+from collections.abc import Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,27 +11,67 @@ from axela.infrastructure.telegram.bot import DigestBot
 class TestDigestBot:
     """Tests for DigestBot."""
 
-    @pytest.fixture
+    # Construction pulls in python-telegram-bot machinery; one instance
+    # per class is enough since ``_reset_bot`` restores the mutable state.
+    @pytest.fixture(scope="class")
     def bot(self) -> DigestBot:
-        """Return DigestBot instance."""
+        """Return DigestBot instance shared across the class."""
         return DigestBot(token="test-token-123")
 
-    @pytest.fixture
-    def mock_update(self) -> MagicMock:
-        """Return mock Telegram Update."""
+    @pytest.fixture(autouse=True)
+    def _reset_bot(self, bot: DigestBot) -> Generator[None]:
+        """Restore the shared bot's state so tests never leak into each other."""
+        yield
+        bot._app = None
+        bot._chat_id = None
+        bot._digest_trigger = None
+        bot._status_func = None
+
+    # Mock construction is the bulk of these handler microtests; build
+    # each graph once per class and reset it between tests instead.
+    @pytest.fixture(scope="class")
+    def _update_proto(self) -> MagicMock:
+        """Build the mock Telegram Update shared across the class."""
         update = MagicMock()
         update.effective_chat = MagicMock()
-        update.effective_chat.id = 12345
         return update
 
     @pytest.fixture
-    def mock_context(self) -> MagicMock:
-        """Return mock Telegram context."""
+    def mock_update(self, _update_proto: MagicMock) -> MagicMock:
+        """Return mock Telegram Update, reset for this test."""
+        _update_proto.reset_mock(return_value=True, side_effect=True)
+        _update_proto.effective_chat.id = 12345
+        return _update_proto
+
+    @pytest.fixture(scope="class")
+    def _context_proto(self) -> MagicMock:
+        """Build the mock Telegram context shared across the class."""
         context = MagicMock()
         context.bot = AsyncMock()
         context.bot.send_message = AsyncMock()
         return context
 
+    @pytest.fixture
+    def mock_context(self, _context_proto: MagicMock) -> MagicMock:
+        """Return mock Telegram context, reset for this test."""
+        _context_proto.reset_mock(return_value=True, side_effect=True)
+        return _context_proto
+
+    @pytest.fixture(scope="class")
+    def _app_proto(self) -> MagicMock:
+        """Build the mock application shared by the send tests."""
+        app = MagicMock()
+        app.bot = AsyncMock()
+        return app
+
+    @pytest.fixture
+    def bot_with_app(self, bot: DigestBot, _app_proto: MagicMock) -> DigestBot:
+        """Return the bot wired to a reset mock application and chat id."""
+        _app_proto.reset_mock(return_value=True, side_effect=True)
+        bot._app = _app_proto
+        bot._chat_id = 99999
+        return bot
+
     def test_init(self, bot: DigestBot) -> None:
         """Test bot initialization."""
         assert bot._token == "test-token-123"
@@ -131,53 +172,38 @@ class TestDigestBot:
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_send_message_success(self, bot: DigestBot) -> None:
+    async def test_send_message_success(self, bot_with_app: DigestBot) -> None:
         """Test send_message sends message and returns message ID."""
         mock_message = MagicMock()
         mock_message.message_id = 12345
+        send_message = bot_with_app._app.bot.send_message
+        send_message.return_value = mock_message
 
-        mock_bot = AsyncMock()
-        mock_bot.send_message = AsyncMock(return_value=mock_message)
-
-        bot._app = MagicMock()
-        bot._app.bot = mock_bot
-        bot._chat_id = 99999
-
-        result = await bot.send_message("Hello!", parse_mode="HTML")
+        result = await bot_with_app.send_message("Hello!", parse_mode="HTML")
 
         assert result == 12345
-        mock_bot.send_message.assert_called_once_with(chat_id=99999, text="Hello!", parse_mode="HTML")
+        send_message.assert_called_once_with(chat_id=99999, text="Hello!", parse_mode="HTML")
 
     @pytest.mark.asyncio
-    async def test_send_message_handles_exception(self, bot: DigestBot) -> None:
+    async def test_send_message_handles_exception(self, bot_with_app: DigestBot) -> None:
         """Test send_message returns None on exception."""
-        mock_bot = AsyncMock()
-        mock_bot.send_message = AsyncMock(side_effect=Exception("Network error"))
-
-        bot._app = MagicMock()
-        bot._app.bot = mock_bot
-        bot._chat_id = 99999
+        bot_with_app._app.bot.send_message.side_effect = Exception("Network error")
 
-        result = await bot.send_message("Hello!")
+        result = await bot_with_app.send_message("Hello!")
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_send_error(self, bot: DigestBot) -> None:
+    async def test_send_error(self, bot_with_app: DigestBot) -> None:
         """Test send_error formats error message correctly."""
         mock_message = MagicMock()
         mock_message.message_id = 1
+        send_message = bot_with_app._app.bot.send_message
+        send_message.return_value = mock_message
 
-        mock_bot = AsyncMock()
-        mock_bot.send_message = AsyncMock(return_value=mock_message)
-
-        bot._app = MagicMock()
-        bot._app.bot = mock_bot
-        bot._chat_id = 99999
-
-        await bot.send_error("Something went wrong")
+        await bot_with_app.send_error("Something went wrong")
 
-        mock_bot.send_message.assert_called_once()
-        call_args = mock_bot.send_message.call_args
+        send_message.assert_called_once()
+        call_args = send_message.call_args
         assert "Error" in call_args.kwargs["text"]
         assert "Something went wrong" in call_args.kwargs["text"]
 
@@ -198,30 +224,34 @@ class TestDigestBot:
         assert "12345" in call_args.kwargs["text"]  # chat ID shown
 
     @pytest.mark.asyncio
-    async def test_handle_start_returns_if_no_effective_chat(
+    @pytest.mark.parametrize("handler_name", ["_handle_start", "_handle_help"])
+    async def test_handler_returns_if_no_effective_chat(
         self,
         bot: DigestBot,
         mock_context: MagicMock,
+        handler_name: str,
     ) -> None:
-        """Test _handle_start returns early if no effective_chat."""
+        """Test handlers return early if no effective_chat."""
         update = MagicMock()
         update.effective_chat = None
 
-        await bot._handle_start(update, mock_context)
+        await getattr(bot, handler_name)(update, mock_context)
 
         mock_context.bot.send_message.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_handle_now_unauthorized_user(
+    @pytest.mark.parametrize("handler_name", ["_handle_now", "_handle_status"])
+    async def test_handler_rejects_unauthorized_user(
         self,
         bot: DigestBot,
         mock_update: MagicMock,
         mock_context: MagicMock,
+        handler_name: str,
     ) -> None:
-        """Test _handle_now rejects unauthorized user."""
+        """Test handlers reject a chat other than the configured one."""
         bot._chat_id = 99999  # Different from mock_update's 12345
 
-        await bot._handle_now(mock_update, mock_context)
+        await getattr(bot, handler_name)(mock_update, mock_context)
 
         mock_context.bot.send_message.assert_called_once()
         call_args = mock_context.bot.send_message.call_args
@@ -291,22 +321,6 @@ class TestDigestBot:
         last_call = mock_context.bot.send_message.call_args_list[1]
         assert "Failed to generate digest" in last_call.kwargs["text"]
 
-    @pytest.mark.asyncio
-    async def test_handle_status_unauthorized_user(
-        self,
-        bot: DigestBot,
-        mock_update: MagicMock,
-        mock_context: MagicMock,
-    ) -> None:
-        """Test _handle_status rejects unauthorized user."""
-        bot._chat_id = 99999  # Different from mock_update's 12345
-
-        await bot._handle_status(mock_update, mock_context)
-
-        mock_context.bot.send_message.assert_called_once()
-        call_args = mock_context.bot.send_message.call_args
-        assert "not authorized" in call_args.kwargs["text"]
-
     @pytest.mark.asyncio
     async def test_handle_status_default_status(
         self,
@@ -385,17 +399,3 @@ class TestDigestBot:
         assert "/now" in text
         assert "/status" in text
         assert "/help" in text
-
-    @pytest.mark.asyncio
-    async def test_handle_help_returns_if_no_effective_chat(
-        self,
-        bot: DigestBot,
-        mock_context: MagicMock,
-    ) -> None:
-        """Test _handle_help returns early if no effective_chat."""
-        update = MagicMock()
-        update.effective_chat = None
-
-        await bot._handle_help(update, mock_context)
-
-        mock_context.bot.send_message.assert_not_called()
@@ -1,5 +1,6 @@
 """Tests for Gmail collector."""
 
+from collections.abc import Generator
 from datetime import UTC, datetime
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -10,16 +11,77 @@ import pytest
 from axela.domain.enums import ItemType, SourceType
 from axela.infrastructure.collectors.gmail import GmailCollector
 
+# Shared inputs for the query-builder and conversion tests; none of
+# them mutate these, so one instance each is enough.
+_SINCE = datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
+_SOURCE_ID = str(uuid4())
+
+# Body-preview payloads, built once at import. The data fields are
+# base64 of the strings noted alongside each payload.
+_PLAIN_PAYLOAD = {
+    "mimeType": "text/plain",
+    "body": {"data": "SGVsbG8gV29ybGQh"},  # "Hello World!"
+}
+_HTML_PAYLOAD = {
+    "mimeType": "text/html",
+    # "<html><body><p>Hello World!</p></body></html>"
+    "body": {"data": "PGh0bWw+PGJvZHk+PHA+SGVsbG8gV29ybGQhPC9wPjwvYm9keT48L2h0bWw+"},
+}
+_MULTIPART_PAYLOAD = {
+    "mimeType": "multipart/alternative",
+    "parts": [
+        {
+            "mimeType": "text/plain",
+            "body": {"data": "UGxhaW4gdGV4dA=="},  # "Plain text"
+        },
+        {
+            "mimeType": "text/html",
+            "body": {"data": "PHA+SFRNTDwvcD4="},  # "<p>HTML</p>"
+        },
+    ],
+}
+_EMPTY_PAYLOAD = {"mimeType": "text/plain", "body": {}}
+
+# Header lists for the extraction tests.
+_HEADERS = [
+    {"name": "Subject", "value": "Test Subject"},
+    {"name": "From", "value": "john@example.com"},
+]
+_UPPERCASE_HEADERS = [{"name": "SUBJECT", "value": "Test"}]
+
+# Chains like ``service.users().messages().list().execute()`` spawn a
+# child mock per attribute access; building the graph once per module
+# and resetting between tests avoids repeating that work. Resetting with
+# return_value=True clears the canned execute() payloads while keeping
+# the child mocks themselves.
+_GMAIL_SERVICE_PROTO = MagicMock()
+
 
 class TestGmailCollector:
     """Tests for GmailCollector."""
 
-    @pytest.fixture
+    # The collector keeps no instance state (tests patch what they need
+    # and the patches are undone at teardown), so one is enough.
+    @pytest.fixture(scope="class")
     def collector(self) -> GmailCollector:
-        """Create a GmailCollector instance."""
+        """Create a GmailCollector instance shared across the class."""
         return GmailCollector()
 
     @pytest.fixture
+    def mock_service(self) -> MagicMock:
+        """Return the shared Gmail service mock, reset for this test."""
+        _GMAIL_SERVICE_PROTO.reset_mock(return_value=True, side_effect=True)
+        return _GMAIL_SERVICE_PROTO
+
+    @pytest.fixture
+    def patched_get_service(self, collector: GmailCollector) -> Generator[MagicMock]:
+        """Patch _get_gmail_service on the collector for the test."""
+        with patch.object(collector, "_get_gmail_service") as patched:
+            yield patched
+
+    # These three fixtures return static payloads that no test mutates,
+    # so one instance per module is enough.
+    @pytest.fixture(scope="module")
     def valid_credentials(self) -> dict[str, Any]:
         """Return valid Gmail OAuth2 credentials."""
         return {
@@ -31,7 +93,7 @@ class TestGmailCollector:
             "scopes": ["https://www.googleapis.com/auth/gmail.readonly"],
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_message_list(self) -> dict[str, Any]:
         """Sample Gmail message list response."""
         return {
@@ -41,7 +103,7 @@ class TestGmailCollector:
             ]
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_message(self) -> dict[str, Any]:
         """Sample Gmail message response."""
         return {
@@ -69,151 +131,134 @@ class TestGmailCollector:
 
     def test_build_query_default(self, collector: GmailCollector) -> None:
         """Test default query generation."""
-        since = datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
-        query = collector._build_query({}, since)
+        query = collector._build_query({}, _SINCE)
 
         assert "after:2024/01/15" in query
 
     def test_build_query_custom(self, collector: GmailCollector) -> None:
         """Test custom query with date filter appended."""
-        since = datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
         config = {"query": "is:unread"}
-        query = collector._build_query(config, since)
+        query = collector._build_query(config, _SINCE)
 
         assert "is:unread" in query
         assert "after:2024/01/15" in query
 
     def test_build_query_custom_with_after(self, collector: GmailCollector) -> None:
         """Test custom query that already has after filter."""
-        since = datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
         config = {"query": "is:unread after:2024/01/01"}
-        query = collector._build_query(config, since)
+        query = collector._build_query(config, _SINCE)
 
         # Should not add another after filter
         assert query == "is:unread after:2024/01/01"
 
-    def test_get_header(self, collector: GmailCollector) -> None:
-        """Test header extraction."""
-        headers = [
-            {"name": "Subject", "value": "Test Subject"},
-            {"name": "From", "value": "john@example.com"},
-        ]
-
-        assert collector._get_header(headers, "Subject") == "Test Subject"
-        assert collector._get_header(headers, "From") == "john@example.com"
-        assert collector._get_header(headers, "Missing") is None
-
-    def test_get_header_case_insensitive(self, collector: GmailCollector) -> None:
-        """Test header extraction is case insensitive."""
-        headers = [{"name": "SUBJECT", "value": "Test"}]
-
-        assert collector._get_header(headers, "subject") == "Test"
-        assert collector._get_header(headers, "Subject") == "Test"
-
-    def test_parse_email_date(self, collector: GmailCollector) -> None:
+    @pytest.mark.parametrize(
+        ("headers", "name", "expected"),
+        [
+            pytest.param(_HEADERS, "Subject", "Test Subject", id="subject"),
+            pytest.param(_HEADERS, "From", "john@example.com", id="from"),
+            pytest.param(_HEADERS, "Missing", None, id="missing"),
+            pytest.param(_UPPERCASE_HEADERS, "subject", "Test", id="lowercase-lookup"),
+            pytest.param(_UPPERCASE_HEADERS, "Subject", "Test", id="titlecase-lookup"),
+        ],
+    )
+    def test_get_header(
+        self,
+        collector: GmailCollector,
+        headers: list[dict[str, str]],
+        name: str,
+        expected: str | None,
+    ) -> None:
+        """Test case-insensitive header extraction."""
+        assert collector._get_header(headers, name) == expected
+
+    @pytest.mark.parametrize(
+        ("date_str", "expected"),
+        [
+            pytest.param("Mon, 15 Jan 2024 10:30:00 +0000", (2024, 1, 15), id="rfc-2822"),
+            pytest.param(None, None, id="none"),
+            pytest.param("invalid", None, id="invalid"),
+        ],
+    )
+    def test_parse_email_date(
+        self,
+        collector: GmailCollector,
+        date_str: str | None,
+        expected: tuple[int, int, int] | None,
+    ) -> None:
         """Test email date parsing."""
-        date_str = "Mon, 15 Jan 2024 10:30:00 +0000"
         result = collector._parse_email_date(date_str)
 
-        assert result is not None
-        assert result.year == 2024
-        assert result.month == 1
-        assert result.day == 15
-
-    def test_parse_email_date_none(self, collector: GmailCollector) -> None:
-        """Test email date parsing with None."""
-        assert collector._parse_email_date(None) is None
-
-    def test_parse_email_date_invalid(self, collector: GmailCollector) -> None:
-        """Test email date parsing with invalid string."""
-        assert collector._parse_email_date("invalid") is None
-
-    def test_extract_sender_name(self, collector: GmailCollector) -> None:
+        if expected is None:
+            assert result is None
+        else:
+            assert result is not None
+            assert (result.year, result.month, result.day) == expected
+
+    @pytest.mark.parametrize(
+        ("sender", "expected"),
+        [
+            pytest.param("John Doe <john@example.com>", "John Doe", id="display-name"),
+            pytest.param('"Jane Doe" <jane@example.com>', "Jane Doe", id="quoted-name"),
+            pytest.param("plain@example.com", "plain@example.com", id="bare-address"),
+        ],
+    )
+    def test_extract_sender_name(
+        self,
+        collector: GmailCollector,
+        sender: str,
+        expected: str,
+    ) -> None:
         """Test sender name extraction."""
-        assert collector._extract_sender_name("John Doe <john@example.com>") == "John Doe"
-        assert collector._extract_sender_name('"Jane Doe" <jane@example.com>') == "Jane Doe"
-        assert collector._extract_sender_name("plain@example.com") == "plain@example.com"
-
-    def test_extract_body_preview_plain_text(self, collector: GmailCollector) -> None:
-        """Test body preview extraction from plain text."""
-        payload = {
-            "mimeType": "text/plain",
-            "body": {"data": "SGVsbG8gV29ybGQh"},  # "Hello World!"
-        }
-
-        preview = collector._extract_body_preview(payload)
-        assert preview == "Hello World!"
-
-    def test_extract_body_preview_html(self, collector: GmailCollector) -> None:
-        """Test body preview extraction from HTML (strips tags)."""
-        # Base64 of "<html><body><p>Hello World!</p></body></html>"
-        payload = {
-            "mimeType": "text/html",
-            "body": {"data": "PGh0bWw+PGJvZHk+PHA+SGVsbG8gV29ybGQhPC9wPjwvYm9keT48L2h0bWw+"},
-        }
-
-        preview = collector._extract_body_preview(payload)
-        assert "Hello World!" in preview
-        assert "<" not in preview  # HTML tags stripped
-
-    def test_extract_body_preview_multipart(self, collector: GmailCollector) -> None:
-        """Test body preview extraction from multipart message."""
-        payload = {
-            "mimeType": "multipart/alternative",
-            "parts": [
-                {
-                    "mimeType": "text/plain",
-                    "body": {"data": "UGxhaW4gdGV4dA=="},  # "Plain text"
-                },
-                {
-                    "mimeType": "text/html",
-                    "body": {"data": "PHA+SFRNTDwvcD4="},  # "<p>HTML</p>"
-                },
-            ],
-        }
-
+        assert collector._extract_sender_name(sender) == expected
+
+    @pytest.mark.parametrize(
+        ("payload", "expected", "exact"),
+        [
+            pytest.param(_PLAIN_PAYLOAD, "Hello World!", True, id="plain-text"),
+            pytest.param(_HTML_PAYLOAD, "Hello World!", False, id="html-strips-tags"),
+            # Multipart prefers the plain-text part.
+            pytest.param(_MULTIPART_PAYLOAD, "Plain text", True, id="multipart"),
+            pytest.param(_EMPTY_PAYLOAD, "", True, id="empty-body"),
+        ],
+    )
+    def test_extract_body_preview(
+        self,
+        collector: GmailCollector,
+        payload: dict[str, Any],
+        expected: str,
+        exact: bool,
+    ) -> None:
+        """Test body preview extraction across payload shapes."""
         preview = collector._extract_body_preview(payload)
-        assert preview == "Plain text"  # Prefers plain text
 
-    def test_extract_body_preview_empty(self, collector: GmailCollector) -> None:
-        """Test body preview extraction with no body."""
-        payload = {"mimeType": "text/plain", "body": {}}
-        assert collector._extract_body_preview(payload) == ""
+        if exact:
+            assert preview == expected
+        else:
+            assert expected in preview
+            assert "<" not in preview  # HTML tags stripped
 
     @pytest.mark.asyncio
     async def test_collect_success(
         self,
         collector: GmailCollector,
+        mock_service: MagicMock,
+        patched_get_service: MagicMock,
         valid_credentials: dict[str, Any],
         sample_message_list: dict[str, Any],
         sample_message: dict[str, Any],
     ) -> None:
         """Test successful collection."""
-        mock_service = MagicMock()
-        mock_users = MagicMock()
-        mock_messages = MagicMock()
-
-        # Setup chain: service.users().messages()
-        mock_service.users.return_value = mock_users
-        mock_users.messages.return_value = mock_messages
-
-        # Mock list response
-        mock_list = MagicMock()
-        mock_list.execute.return_value = sample_message_list
-        mock_messages.list.return_value = mock_list
-
-        # Mock get response
-        mock_get = MagicMock()
-        mock_get.execute.return_value = sample_message
-        mock_messages.get.return_value = mock_get
-
-        with patch.object(collector, "_get_gmail_service", return_value=mock_service):
-            items = await collector.collect(
-                source_id=str(uuid4()),
-                credentials=valid_credentials,
-                config={},
-                since=datetime(2024, 1, 15, tzinfo=UTC),
-            )
+        messages = mock_service.users.return_value.messages.return_value
+        messages.list.return_value.execute.return_value = sample_message_list
+        messages.get.return_value.execute.return_value = sample_message
+        patched_get_service.return_value = mock_service
+
+        items = await collector.collect(
+            source_id=_SOURCE_ID,
+            credentials=valid_credentials,
+            config={},
+            since=_SINCE,
+        )
 
         assert len(items) == 2
         item = items[0]
@@ -227,19 +272,16 @@ class TestGmailCollector:
     async def test_validate_credentials_success(
         self,
         collector: GmailCollector,
+        mock_service: MagicMock,
+        patched_get_service: MagicMock,
         valid_credentials: dict[str, Any],
     ) -> None:
         """Test credential validation success."""
-        mock_service = MagicMock()
-        mock_users = MagicMock()
-        mock_get_profile = MagicMock()
-        mock_get_profile.execute.return_value = {"emailAddress": "test@gmail.com"}
-
-        mock_service.users.return_value = mock_users
-        mock_users.getProfile.return_value = mock_get_profile
+        profile = mock_service.users.return_value.getProfile.return_value
+        profile.execute.return_value = {"emailAddress": "test@gmail.com"}
+        patched_get_service.return_value = mock_service
 
-        with patch.object(collector, "_get_gmail_service", return_value=mock_service):
-            result = await collector.validate_credentials(valid_credentials)
+        result = await collector.validate_credentials(valid_credentials)
 
         assert result is True
 
@@ -247,11 +289,13 @@ class TestGmailCollector:
     async def test_validate_credentials_failure(
         self,
         collector: GmailCollector,
+        patched_get_service: MagicMock,
         valid_credentials: dict[str, Any],
     ) -> None:
         """Test credential validation failure."""
-        with patch.object(collector, "_get_gmail_service", return_value=None):
-            result = await collector.validate_credentials(valid_credentials)
+        patched_get_service.return_value = None
+
+        result = await collector.validate_credentials(valid_credentials)
 
         assert result is False
 
@@ -259,10 +303,12 @@ class TestGmailCollector:
     async def test_validate_credentials_missing(
         self,
         collector: GmailCollector,
+        patched_get_service: MagicMock,
     ) -> None:
         """Test credential validation with missing credentials."""
-        with patch.object(collector, "_get_gmail_service", return_value=None):
-            result = await collector.validate_credentials({})
+        patched_get_service.return_value = None
+
+        result = await collector.validate_credentials({})
 
         assert result is False
 
@@ -272,10 +318,9 @@ class TestGmailCollector:
         sample_message: dict[str, Any],
     ) -> None:
         """Test message to DigestItem conversion."""
-        source_id = str(uuid4())
-        item = collector._message_to_digest_item(source_id, sample_message)
+        item = collector._message_to_digest_item(_SOURCE_ID, sample_message)
 
-        assert item.source_id == UUID(source_id)
+        assert item.source_id == UUID(_SOURCE_ID)
         assert item.external_id == "msg123"
         assert item.item_type == ItemType.EMAIL
         assert item.title == "Test Subject"
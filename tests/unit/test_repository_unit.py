@@ -261,6 +261,23 @@ class TestSourceRepositoryImpl:
 
         assert len(sources) == 1
 
+    @pytest.mark.asyncio
+    async def test_count_active_by_project(
+        self,
+        repo: SourceRepositoryImpl,
+        session: AsyncMock,
+    ) -> None:
+        """Test counting active sources grouped by project."""
+        project_id = uuid4()
+
+        mock_result = MagicMock()
+        mock_result.all.return_value = [(project_id, 3)]
+        session.execute.return_value = mock_result
+
+        counts = await repo.count_active_by_project()
+
+        assert counts == {project_id: 3}
+
     @pytest.mark.asyncio
     async def test_get_by_type(
         self,
@@ -440,6 +457,28 @@ class TestSettingsRepositoryImpl:
             session.add.assert_called_once()
             assert setting.key == "new_key"
 
+    @pytest.mark.asyncio
+    async def test_set_many_executes_single_statement(
+        self,
+        repo: SettingsRepositoryImpl,
+        session: AsyncMock,
+    ) -> None:
+        """Test batch upsert issues one statement for all keys."""
+        await repo.set_many({"key1": "value1", "key2": "value2"})
+
+        session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_set_many_empty_is_noop(
+        self,
+        repo: SettingsRepositoryImpl,
+        session: AsyncMock,
+    ) -> None:
+        """Test batch upsert with no items does not hit the database."""
+        await repo.set_many({})
+
+        session.execute.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_set_updates_existing(
         self,
@@ -5,6 +5,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from axela.infrastructure.database.types import json_decode, json_encode
+
 
 class TestGetAsyncEngine:
     """Tests for get_async_engine."""
@@ -40,6 +42,8 @@ class TestGetAsyncEngine:
                 pool_pre_ping=True,
                 pool_size=5,
                 max_overflow=10,
+                json_serializer=json_encode,
+                json_deserializer=json_decode,
             )
 
         get_async_engine.cache_clear()
@@ -103,6 +107,8 @@ class TestGetAsyncEngine:
                 "sqlite+aiosqlite:///axela.db",
                 echo=False,
                 connect_args={"check_same_thread": False},
+                json_serializer=json_encode,
+                json_deserializer=json_decode,
             )
 
         get_async_engine.cache_clear()
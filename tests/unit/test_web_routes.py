@@ -1,6 +1,7 @@
 """Tests for web frontend routes."""
 
-from collections.abc import AsyncGenerator
+import asyncio
+from collections.abc import AsyncGenerator, Generator
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
@@ -11,7 +12,7 @@ from httpx import ASGITransport, AsyncClient
 
 from axela.domain.enums import DigestType, SourceType
 from axela.domain.models import Project, Schedule
-from axela.web.routes import api_router, router
+from axela.web.routes import _reset_status_cache, api_router, router
 
 
 @pytest.fixture
@@ -40,7 +41,10 @@ def mock_source_repo() -> AsyncMock:
     """Create mock source repository."""
     repo = AsyncMock()
     repo.get_active = AsyncMock(return_value=[])
+    repo.count_active_by_project = AsyncMock(return_value={})
+    repo.get_active_with_project = AsyncMock(return_value=[])
     repo.get_by_project = AsyncMock(return_value=[])
+    repo.get_by_project_with_project = AsyncMock(return_value=[])
     repo.get_by_id = AsyncMock(return_value=None)
     repo.create = AsyncMock()
     repo.update = AsyncMock()
@@ -65,8 +69,10 @@ def mock_settings_repo() -> AsyncMock:
     """Create mock settings repository."""
     repo = AsyncMock()
     repo.get_all = AsyncMock(return_value=[])
+    repo.get_all_map = AsyncMock(return_value={})
     repo.get = AsyncMock(return_value=None)
     repo.set = AsyncMock()
+    repo.set_many = AsyncMock()
     repo.delete = AsyncMock(return_value=True)
     return repo
 
@@ -161,6 +167,26 @@ class TestProjectsPage:
         assert response.status_code == 200
         assert "Нет проектов" in response.text
 
+    @pytest.mark.asyncio
+    async def test_projects_page_returns_304_on_matching_etag(self, client: AsyncClient) -> None:
+        """Test conditional navigation with an unchanged data version."""
+        first = await client.get("/projects")
+        etag = first.headers["ETag"]
+
+        second = await client.get("/projects", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_projects_page_etag_changes_after_write(self, client: AsyncClient) -> None:
+        """Test that a project write invalidates the list ETag."""
+        first = await client.get("/projects")
+        etag = first.headers["ETag"]
+
+        await client.post("/api/projects", data={"name": "New Project"})
+
+        second = await client.get("/projects", headers={"If-None-Match": etag})
+        assert second.status_code == 200
+
     @pytest.mark.asyncio
     async def test_projects_page_shows_projects(
         self,
@@ -202,7 +228,7 @@ class TestSourcesPage:
 
         response = await client.get(f"/sources?project={project_id}")
         assert response.status_code == 200
-        mock_source_repo.get_by_project.assert_called_once_with(project_id)
+        mock_source_repo.get_by_project_with_project.assert_called_once_with(project_id)
 
 
 class TestSchedulesPage:
@@ -547,12 +573,19 @@ class TestSettingsAPI:
             },
         )
         assert response.status_code == 200
-        assert mock_settings_repo.set.call_count == 2
+        mock_settings_repo.set_many.assert_called_once_with({"telegram_chat_id": "123456", "digest_language": "en"})
 
 
 class TestStatusAPI:
     """Tests for status HTMX API."""
 
+    @pytest.fixture(autouse=True)
+    def _fresh_status_cache(self) -> Generator[None]:
+        """Reset the status TTL cache around each test."""
+        _reset_status_cache()
+        yield
+        _reset_status_cache()
+
     @pytest.mark.asyncio
     async def test_get_status(
         self,
@@ -563,6 +596,7 @@ class TestStatusAPI:
         response = await client.get("/api/status")
         assert response.status_code == 200
         assert "Database" in response.text
+        assert "ETag" in response.headers
 
     @pytest.mark.asyncio
     async def test_get_status_database_error(
@@ -576,3 +610,50 @@ class TestStatusAPI:
         response = await client.get("/api/status")
         assert response.status_code == 200
         # Should still render but show error state
+
+    @pytest.mark.asyncio
+    async def test_get_status_cached_within_ttl(
+        self,
+        client: AsyncClient,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Test that repeated polls within the TTL skip the DB probe."""
+        await client.get("/api/status")
+        await client.get("/api/status")
+
+        mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_status_concurrent_polls_share_one_probe(
+        self,
+        client: AsyncClient,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Test that simultaneous cache misses coalesce into a single probe."""
+
+        async def slow_execute(*args: object, **kwargs: object) -> None:
+            await asyncio.sleep(0.05)
+
+        mock_session.execute = AsyncMock(side_effect=slow_execute)
+
+        responses = await asyncio.gather(
+            client.get("/api/status"),
+            client.get("/api/status"),
+            client.get("/api/status"),
+        )
+
+        assert all(response.status_code == 200 for response in responses)
+        mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_status_returns_304_on_matching_etag(
+        self,
+        client: AsyncClient,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Test conditional requests with a matching ETag."""
+        first = await client.get("/api/status")
+        etag = first.headers["ETag"]
+
+        second = await client.get("/api/status", headers={"If-None-Match": etag})
+        assert second.status_code == 304